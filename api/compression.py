@@ -0,0 +1,86 @@
+"""
+gzip compression for JSON responses.
+
+Purpose
+-------
+List and analytics payloads repeat the same keys and category strings over and
+over, so they compress very well. For large collections the wire transfer (and
+the client-side read) costs more than compressing on the server.
+
+Design
+------
+A single 'after_request' hook, stdlib 'gzip'/'zlib' only (no extra dependency).
+Streamed responses are compressed incrementally as they are sent.
+Tunables live in 'app.config' so deployments can adjust them:
+    - COMPRESS_MIMETYPES: response mimetypes eligible for compression.
+    - COMPRESS_LEVEL:     gzip level (1 fastest .. 9 smallest).
+    - COMPRESS_MIN_SIZE:  bodies smaller than this (bytes) are sent as-is.
+"""
+
+from __future__ import annotations
+
+import gzip
+import zlib
+
+from flask import Flask, Response, request
+
+DEFAULTS = {
+    "COMPRESS_MIMETYPES": ["application/json"],
+    "COMPRESS_LEVEL": 5,
+    "COMPRESS_MIN_SIZE": 500,
+}
+
+
+def init_compression(app: Flask) -> None:
+    """Register the gzip hook on 'app' (config defaults are filled in if unset)."""
+    for key, value in DEFAULTS.items():
+        app.config.setdefault(key, value)
+
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        return _gzip_response(app, response)
+
+
+def _gzip_response(app: Flask, response: Response) -> Response:
+    """gzip 'response' in place when the client accepts it and it's worth it."""
+    config = app.config
+    if (
+        response.mimetype not in config["COMPRESS_MIMETYPES"]
+        or not 200 <= response.status_code < 300
+        or response.status_code == 204
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    # The body depends on Accept-Encoding from here on, even if we skip it.
+    response.vary.add("Accept-Encoding")
+    if not request.accept_encodings["gzip"]:
+        return response
+
+    if response.is_streamed:
+        # Size is unknown up front: always compress, chunk by chunk.
+        response.response = _gzip_stream(
+            response.iter_encoded(), config["COMPRESS_LEVEL"]
+        )
+        response.headers.pop("Content-Length", None)
+        response.headers["Content-Encoding"] = "gzip"
+        return response
+
+    data = response.get_data()
+    if len(data) < config["COMPRESS_MIN_SIZE"]:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=config["COMPRESS_LEVEL"]))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+def _gzip_stream(chunks, level: int):
+    """Incrementally gzip an iterable of byte chunks."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            yield out
+    yield compressor.flush()
@@ -0,0 +1,73 @@
+"""
+orjson-backed JSON provider for the Flask app.
+
+Purpose
+-------
+Flask's default provider serializes through the stdlib 'json' module, which is
+pure Python on the encode side and slow on lists of dicts (our most common
+payload). This provider routes every 'jsonify' call (REST and GraphQL) through
+'orjson' instead, so no call sites need to change.
+
+Design
+------
+- 'dumps' honours the provider attributes Flask already exposes ('sort_keys',
+  'compact', 'default'), so app configuration keeps working as documented.
+  Per-call 'sort_keys', 'indent' and 'default' kwargs override them.
+- numpy arrays and scalars are serialized natively ('OPT_SERIALIZE_NUMPY');
+  numpy itself is not required.
+- 'encode' is the bytes-level entry point, also used by streamed responses
+  ('api.rest') so every body goes through the same options and 'default'.
+- 'response' encodes straight to bytes and hands them to the response class,
+  skipping the str round-trip the base implementation does.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Drop-in replacement for Flask's 'DefaultJSONProvider' using orjson."""
+
+    def _option(self, indent: Any = None, sort_keys: bool | None = None) -> int:
+        """Translate provider settings into an orjson option bitmask."""
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys if sort_keys is None else sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def encode(self, obj: Any, **kwargs: Any) -> bytes:
+        """Serialize 'obj' to UTF-8 bytes.
+
+        Honours the 'sort_keys', 'indent' and 'default' kwargs; other stdlib
+        'json.dumps' kwargs have no orjson equivalent and are ignored.
+        """
+        return orjson.dumps(
+            obj,
+            default=kwargs.get("default", self.default),
+            option=self._option(kwargs.get("indent"), kwargs.get("sort_keys")),
+        )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize 'obj' to a JSON string."""
+        return self.encode(obj, **kwargs).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON text or UTF-8 bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Build a JSON response without decoding the encoded body back to str.
+
+        Mirrors 'DefaultJSONProvider.response': indentation is used when
+        'compact' is False, or when it is None and the app is in debug mode.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        body = self.encode(obj, indent=2 if pretty else None) + b"\n"
+        return self._app.response_class(body, mimetype=self.mimetype)
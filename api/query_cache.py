@@ -0,0 +1,70 @@
+"""
+Parse/validation cache for GraphQL documents.
+
+Purpose
+-------
+'graphql_sync' lexes, parses and validates the query document on every POST.
+Clients (GraphiQL, the GUI, scripts) send the same handful of query strings
+over and over, so both steps are memoized here and plugged into Ariadne via
+its 'query_parser' / 'query_validator' hooks.
+
+Design
+------
+- Parsing is an 'lru_cache' keyed by the raw query string. Identical strings
+  get back the *same* 'DocumentNode' object.
+- Validation results are keyed by the identity of that document. Each entry
+  keeps a strong reference to its document, so an id can't be recycled while
+  its entry exists.
+- Both caches are bounded by 'QUERY_CACHE_SIZE'. Parse errors are never
+  cached ('lru_cache' does not store exceptions).
+- The app uses one schema and one rule set, so neither is part of the key.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from typing import Any
+
+from graphql import DocumentNode, GraphQLError, GraphQLSchema, parse, validate
+
+QUERY_CACHE_SIZE = 256
+
+_validated: dict[int, tuple[DocumentNode, list[GraphQLError]]] = {}
+_validated_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _parse(query: str) -> DocumentNode:
+    return parse(query)
+
+
+def cached_query_parser(context_value: Any, data: dict) -> DocumentNode:
+    """Ariadne 'query_parser': parse 'data["query"]' once per distinct string."""
+    return _parse(data["query"])
+
+
+def cached_query_validator(
+    schema: GraphQLSchema, document_ast: DocumentNode, *args: Any, **kwargs: Any
+) -> list[GraphQLError]:
+    """Ariadne 'query_validator': validate each cached document only once."""
+    key = id(document_ast)
+    with _validated_lock:
+        hit = _validated.get(key)
+    if hit is not None and hit[0] is document_ast:
+        return hit[1]
+
+    errors = validate(schema, document_ast, *args, **kwargs)
+    with _validated_lock:
+        _validated[key] = (document_ast, errors)
+        if len(_validated) > QUERY_CACHE_SIZE:
+            # Dicts keep insertion order: drop the oldest entry.
+            del _validated[next(iter(_validated))]
+    return errors
+
+
+def clear_query_cache() -> None:
+    """Forget all parsed and validated documents."""
+    _parse.cache_clear()
+    with _validated_lock:
+        _validated.clear()
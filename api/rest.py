@@ -13,16 +13,68 @@ GET /items/search?keyword=...   -> search items by keyword (name)
 GET /items/filter?category=...  -> filter items by exact category (case-insensitive)
 GET /analytics/category         -> counts by category
 GET /analytics/time             -> counts by time period
+
+All GET routes carry a weak ETag tied to the collection file and return 304
+for a matching If-None-Match (see 'conditional_get').
 """
 
 from __future__ import annotations
 
-from flask import Blueprint, request, jsonify
+from functools import wraps
+
+from flask import Blueprint, Response, current_app, request, jsonify, make_response
 import api.services as services
 
 rest = Blueprint("rest", __name__)
 
+# Clients may keep responses but must revalidate; a matching ETag costs a 304.
+CACHE_CONTROL = "private, no-cache"
+
+# Lists longer than this are streamed in chunks of this many items.
+STREAM_CHUNK = 500
+
+
+def _iter_json_array(items: list, chunk_size: int, encode):
+    """Yield 'items' as a JSON array, encoding 'chunk_size' items at a time.
+
+    Only one encoded chunk is alive at once, instead of the whole body next to
+    the Python list, and the first bytes go out before the rest is encoded.
+    'encode' is the app's JSON provider encoder, so streamed and buffered
+    responses serialize values the same way.
+    """
+    yield b"["
+    for start in range(0, len(items), chunk_size):
+        if start:
+            yield b","
+        # Strip the brackets of each encoded slice; the outer ones are ours.
+        chunk = items[start:start + chunk_size]
+        yield encode(chunk)[1:-1]
+    yield b"]\n"
+
+
+def conditional_get(view):
+    """Add ETag/Cache-Control to a GET view and answer If-None-Match with 304.
+
+    The ETag comes from 'services.collection_etag()' (file mtime/size), so a
+    304 is returned without loading, filtering or serializing any items. The
+    tag is weak because gzip and identity encodings share it.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        etag = services.collection_etag()
+        if etag is not None and request.if_none_match.contains_weak(etag):
+            resp = make_response("", 304)
+        else:
+            resp = make_response(view(*args, **kwargs))
+            if etag is None or resp.status_code != 200:
+                return resp
+        resp.set_etag(etag, weak=True)
+        resp.headers["Cache-Control"] = CACHE_CONTROL
+        return resp
+    return wrapper
+
 @rest.route("/items/<int:item_id>", methods=["GET"])
+@conditional_get
 def get_item_rest(item_id):
     """Return a single item by ID.
     
@@ -38,14 +90,22 @@ def get_item_rest(item_id):
     return jsonify({"error": "Not found"}), 404
 
 @rest.route("/items", methods=["GET"])
+@conditional_get
 def list_items_rest():
     """Return all items.
 
+    Large collections (more than 'STREAM_CHUNK' items) are streamed as a
+    chunked response instead of being encoded into one buffer.
+
     Returns:
         200 + JSON array of items (possibly empty)
     """
     items = services.get_all_items()
-    return jsonify(items), 200
+    if len(items) <= STREAM_CHUNK:
+        return jsonify(items), 200
+    # Bound now: the generator runs after the app context is gone
+    body = _iter_json_array(items, STREAM_CHUNK, current_app.json.encode)
+    return Response(body, mimetype="application/json"), 200
 
 @rest.route("/items", methods=["POST"])
 def create_item_rest():
@@ -72,6 +132,7 @@ def create_item_rest():
     return jsonify(new), 201
 
 @rest.route("/items/search", methods=["GET"])
+@conditional_get
 def search_items_rest():
     """Search items by keyword in the name field.
     
@@ -85,6 +146,7 @@ def search_items_rest():
     return jsonify(services.search_items(keyword)), 200
 
 @rest.route("/items/filter", methods=["GET"])
+@conditional_get
 def filter_items_rest():
     """Filter items by category (case-insensitive exact match).
     
@@ -98,6 +160,7 @@ def filter_items_rest():
     return jsonify(services.filter_items(category)), 200
 
 @rest.route("/analytics/category", methods=["GET"])
+@conditional_get
 def category_dist_rest():
     """Aggregate: quantity per category.
     
@@ -107,6 +170,7 @@ def category_dist_rest():
     return jsonify(services.category_distribution()), 200
 
 @rest.route("/analytics/time", methods=["GET"])
+@conditional_get
 def time_dist_rest():
     """Aggregate: quantity per time period.
 
@@ -8,20 +8,20 @@
        1) REST (via 'api.rest' blueprint) for straightforward CRUD calls.
        2) GraphQL (via Ariadne) for flexible querying from richer clients.
     - Resolvers are intentionally "pass-through" to 'services' to avoid logic drift.
+    - Concurrency: handlers are sync and served by a threaded WSGI server. File I/O
+      in 'services' is behind a lock-protected in-memory cache, so concurrent
+      requests mostly read from memory rather than blocking on disk.
     
     This file also wires up the built-in GraphiQL explorer at GET /graphql.
+    
+    Run it as a module ('python -m api.server') or via the 'curation-server'
+    entry point, not as a loose script, so 'api' and 'collectory' import as packages.
  """
 
-import os, sys
-
-# --- Local path bootstrap -----------------------------------------------------
-# Make project imports work when running 'python api/server.py' directly.
-from collectory.collector import load_items
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-sys.path.insert(0, PROJECT_ROOT)
+import functools
 
 # --- Web / GraphQL deps -------------------------------------------------------
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g, has_request_context
 from ariadne import (
     QueryType,
     MutationType,
@@ -32,6 +32,9 @@ from ariadne.explorer import ExplorerGraphiQL
 
 # --- REST blueprint (mounted below) ------------------------------------------
 from api.rest import rest
+from api.json_provider import OrjsonProvider
+from api.compression import init_compression
+from api.query_cache import cached_query_parser, cached_query_validator
 
 # --- Domain services (single source of truth) --------------------------------
 import api.services as services
@@ -39,8 +42,17 @@ import api.services as services
 # ---------------------------- Thin service wrappers ---------------------------
 # These wrappers exist to keep resolvers tiny and to make this module readable.
 def get_item_by_id(item_id: int):
-    """Return a single item dict or None from services."""
-    return services.get_item_by_id(item_id)
+    """Return a single item dict or None from services.
+    
+    Within a request, lookups are memoized per id (DataLoader-style), so a query
+    that aliases 'getItem' several times for the same id resolves it once.
+    """
+    if not has_request_context():
+        return services.get_item_by_id(item_id)
+    memo = g.setdefault("item_by_id", {})
+    if item_id not in memo:
+        memo[item_id] = services.get_item_by_id(item_id)
+    return memo[item_id]
 
 def search_items(keyword: str):
     """Return list of items whose name contain 'keyword' (case-insensitive)."""
@@ -133,17 +145,33 @@ def resolve_create_item(_, info, name, category, quantity):
     """Create a new item"""
     return create_item(name, category, quantity)
 
-# Build executable schema once at import time.
-schema = make_executable_schema(type_defs, query, mutation)
+# Build the executable schema once per process. Memoized so re-imports (e.g. the
+# dev reloader or tests importing the module under another name) reuse it.
+@functools.lru_cache(maxsize=1)
+def build_schema():
+    """Parse the SDL and bind resolvers (expensive, done once)."""
+    return make_executable_schema(type_defs, query, mutation)
+
+schema = build_schema()
 
 # ---------------------------- Flask app wiring --------------------------------
 app = Flask(__name__)
+# Serialize every jsonify() call (REST + GraphQL) through orjson.
+app.json = OrjsonProvider(app)
+# Emit compact, insertion-ordered JSON even under 'debug=True' (the Flask 2.3+
+# replacements for JSONIFY_PRETTYPRINT_REGULAR / JSON_SORT_KEYS).
+app.json.compact = True
+app.json.sort_keys = False
+# gzip JSON bodies for clients that accept it (see api.compression).
+init_compression(app)
+
+# The explorer page is static; render it once instead of per request.
+EXPLORER_HTML = ExplorerGraphiQL(title="Curation GraphQL").html(None)
 
 @app.route("/graphql", methods=["GET"])
 def graphql_explorer():
     """Serve GraphiQL explorer for manual testing/development."""
-    html = ExplorerGraphiQL(title="Curation GraphQL").html(None)
-    return html, 200
+    return EXPLORER_HTML, 200
 
 @app.route("/graphql", methods=["POST"])
 def graphql_server():
@@ -151,12 +179,17 @@ def graphql_server():
 
         Expects JSON payload shaped like:
             { "query": "...", "variables": { ... } }
+            
+        Parsed and validated documents are reused across requests with the
+        same query string (see 'api.query_cache').
     """
     data = request.get_json()
     success, result = graphql_sync(
         schema,
         data,
         context_value=request,
+        query_parser=cached_query_parser,
+        query_validator=cached_query_validator,
         debug=app.debug,
     )
     status = 200 if success else 400
@@ -165,6 +198,12 @@ def graphql_server():
 # Mount REST routes alongside GraphQL
 app.register_blueprint(rest)
 
-# Dev server
+def main():
+    """Run the dev server.
+
+    One thread per request, so slow clients don't serialize the others.
+    """
+    app.run(debug=True, port=5000, threaded=True)
+
 if __name__ == "__main__":
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -10,38 +10,125 @@ logic to 'collectory.collector' (write side: create) and 'collectory.analysis'
 
 Design choices
 --------------
-- **Stateless & simple I/O**: Each function loads the current items from 'default_path();
-    on demand. This keeps call sites trivial and avoids caching bugs, at the cost of extra file
-    I/O (fine for a desktop app and small datasets, see TODOs for scaling options).
+- **Cached I/O**: Each function reads the current items through '_items_for_request()'
+    (memoized per HTTP request on 'flask.g') backed by '_cached_items()', which re-parses
+    'default_path()' only when the file's mtime/size changes. Repeated reads (e.g. several
+    GraphQL fields in one request) hit memory instead of the JSON parser.
+    Values derived from the items (aggregates, indexes) are memoized alongside them via
+    '_derived()' and dropped whenever the file is re-read.
 - **Single source of truth**: Domain rules (IDs, timestamps, aggregates) live in the 'collectory.*'
     modules. Services orchestrate those calls
 
 IMPORTANT / TODO
 ----------------
-- **ID type alignment**: Items created by 'create_new_item' use UUID strings for 'id'. Here, 'get_item_by_id'
-    takes and an 'int' and compares directly to 'item["id"]' (string). That will never match. Need to align the types.
+- **ID type alignment**: Items created by 'create_new_item' use UUID strings for 'id'. 'get_item_by_id'
+    now compares ids as strings, but the REST route ('<int:item_id>') and the GraphQL resolver (int cast)
+    still only accept integers.
     - Make REST route use <string:item_id>' and GraphQL resolver stop casting.
 """
 
+import hashlib
+import os
+import threading
 from datetime import datetime
+from flask import g, has_request_context
 from api.utils import default_path
 from collectory.collector import load_items, create_new_item
 from collectory.analysis import (
     search_by_keyword,
     filter_by_category,
+    index_by_category,
+    lowercase_names,
     get_category_distribution,
     get_time_distribution,
 )
 
-def get_item_by_id(item_id: int) -> dict | None:
+# Parsed items of the default collection, keyed by the file's (mtime_ns, size).
+_CACHE: dict = {"stamp": None, "items": None, "derived": {}}
+_CACHE_LOCK = threading.Lock()
+
+def _cached_items() -> list[dict]:
+    """
+    Return the default collection, re-reading the file only when it changed.
+
+    A missing or unreadable file is never cached: 'load_items' reports it and
+    returns an empty list, which is already cheap.
+    """
+    path = default_path()
+    try:
+        st = os.stat(path)
+    except OSError:
+        return load_items(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _CACHE_LOCK:
+        if _CACHE["stamp"] != stamp:
+            _CACHE["items"] = load_items(path)
+            _CACHE["stamp"] = stamp
+            _CACHE["derived"] = {}
+        return _CACHE["items"]
+
+def _items_for_request() -> list[dict]:
+    """
+    Return the collection, resolved at most once per HTTP request.
+
+    Inside a Flask request the list is memoized on 'flask.g', so several resolvers
+    in one GraphQL query skip even the stat() of the file-level cache and all see
+    the same snapshot. Outside a request (GUI, scripts) this is '_cached_items()'.
+    """
+    if not has_request_context():
+        return _cached_items()
+    items = g.get("collection_items")
+    if items is None:
+        items = g.collection_items = _cached_items()
+    return items
+
+def _derived(items: list[dict], key: str, build, optional: bool = False):
+    """
+    Return 'build(items)' memoized while 'items' is the cached collection.
+
+    Reads that bypass the cache (missing file) are computed every time, or
+    return None when 'optional' is set (for lookup indexes, where a one-off
+    build costs more than the plain scan it would replace).
+    """
+    with _CACHE_LOCK:
+        if _CACHE["stamp"] is None or _CACHE["items"] is not items:
+            return None if optional else build(items)
+        derived = _CACHE["derived"]
+        if key not in derived:
+            derived[key] = build(items)
+        return derived[key]
+
+def collection_etag() -> str | None:
+    """
+    Return a short validator for the default collection file, or None if it's missing.
+
+    Derived from the file's (mtime_ns, size), the same stamp the items cache is keyed
+    on, so it changes exactly when a re-read would produce different data.
+    """
+    try:
+        st = os.stat(default_path())
+    except OSError:
+        return None
+    stamp = f"{st.st_mtime_ns}:{st.st_size}".encode()
+    return hashlib.blake2b(stamp, digest_size=8).hexdigest()
+
+def _index_by_id(items: list[dict]) -> dict[str, dict]:
+    """Map str(id) -> item, keeping the first item for duplicate ids."""
+    return {str(item["id"]): item for item in reversed(items)}
+
+def get_item_by_id(item_id: int | str) -> dict | None:
     """
     Return a single item by ID or None if not found.
     
-    NOTE/TODO: 'item_id' is typed as int, but items use UUID **stirng** for 'id'.
-    This strict comparison will fail. 
+    IDs are compared as strings, so both legacy integer ids and UUID strings
+    match. Lookups go through a memoized id -> item index (O(1)).
     """
-    items = load_items(default_path())
-    return next((item for item in items if item["id"] == item_id), None)
+    items = _items_for_request()
+    key = str(item_id)
+    index = _derived(items, "id_index", _index_by_id, optional=True)
+    if index is not None:
+        return index.get(key)
+    return next((item for item in items if str(item["id"]) == key), None)
 
 def create_item(name: str, category: str, quantity: int) -> dict:
     """
@@ -50,13 +137,15 @@ def create_item(name: str, category: str, quantity: int) -> dict:
     Orchestrates:
         - Load current items from the default collection file.
         - Generate a timestamp (YYYY-MM-DD HH:MM:SS).
-        - Delegate to 'create_new_item', which mutates the in-memory list and
+        - Delegate to 'create_new_item' on a copy of the loaded list, which
             returns the created item (with UUID 'id' and 'time' set).
 
     NOTE: This function does **not** persist to disk. Persistence is handled by the 
     CLI's save flow or the GUI's explicit Save action.
     """
-    items = load_items(default_path())
+    # Append to a copy: the cached list (and indexes derived from it) is shared
+    # with concurrent requests and must never see the unsaved item.
+    items = list(_items_for_request())
     ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     return create_new_item(name, items, category, quantity, ts)
 
@@ -64,46 +153,59 @@ def search_items(keyword: str) -> list[dict]:
     """
     Case-insensitive substring search over item names.
 
-    Delegates to 'collectory.analysis.search_by_keyword'.
+    Delegates to 'collectory.analysis.search_by_keyword' with the memoized
+    lowercased names of the cached collection.
     """
-    items = load_items(default_path())
-    return search_by_keyword(items, keyword)
+    items = _items_for_request()
+    names_lower = _derived(items, "names_lower", lowercase_names, optional=True)
+    return search_by_keyword(items, keyword, names_lower=names_lower)
 
 def filter_items(category: str) -> list[dict]:
     """
     Exact, case-insensitive category filter.
 
-    Delegates to 'collectory.analysis.filter_by_category'.
+    Delegates to 'collectory.analysis.filter_by_category' with the memoized
+    category index of the cached collection.
     """
-    items = load_items(default_path())
-    return filter_by_category(items, category)
+    items = _items_for_request()
+    index = _derived(items, "category_index", index_by_category, optional=True)
+    return filter_by_category(items, category, index=index)
+
+def _category_counts(items: list[dict]) -> list[dict]:
+    dist = get_category_distribution(items)
+    return [{"category": k, "count": v} for k, v in dist.items()]
+
+def _time_counts(items: list[dict]) -> list[dict]:
+    td = get_time_distribution(items)
+    return [{"period": k, "count": v} for k, v in td.items()]
 
 def category_distribution() -> list[dict]:
     """
     Aggregate quantity per category.
 
     Returns a list of { "category": <str>, "count": <int> } objects,
-    reshaped from the dict returned by 'get_category_distribution'.
+    reshaped from the dict returned by 'get_category_distribution'. The
+    reshaped list is built once per loaded version of the file and shared
+    between calls, so treat it as read-only.
     """
-    dist = get_category_distribution(load_items(default_path()))
-    return [{"category": k, "count": v} for k, v in dist.items()]
+    return _derived(_items_for_request(), "category_counts", _category_counts)
 
 def time_distribution() -> list[dict]:
     """
     Aggregate quantity per time period (default period: YYYY-MM).
 
     Returns a list of {"period": <str>, "count": <int> } objects,
-    reshaped from the dict returned by 'get_time_distribution'.
+    reshaped from the dict returned by 'get_time_distribution'. The
+    reshaped list is built once per loaded version of the file and shared
+    between calls, so treat it as read-only.
     """
-    td = get_time_distribution(load_items(default_path()))
-    return [{"period": k, "count": v} for k, v in td.items()]
+    return _derived(_items_for_request(), "time_counts", _time_counts)
 
 def get_all_items() -> list[dict]:
     """
     Return the full list of items from teh default collection file.
     
-    TODO: If we introduce a long lived in-memory model in the GUI,
-    we need to pass that into services to avoid re-reading the file
-    on every call.
+    Returns a shallow copy so callers (e.g. the GUI) can append/remove without
+    mutating the shared cache.
     """
-    return load_items(default_path())
+    return list(_items_for_request())
@@ -0,0 +1,19 @@
+"""
+WSGI entry point for running the Curation API under a production server.
+
+The Flask dev server ('python -m api.server') is meant for local work only.
+In production, run the app under gunicorn with several worker processes so
+JSON encoding and file reads use more than one core, e.g.:
+
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 api.wsgi:application
+
+Notes
+-----
+- Each worker process holds its own copy of the 'api.services' items cache.
+  Every worker re-reads the collection file once after it changes.
+- Memory grows roughly linearly with the worker count for large collections.
+"""
+
+from api.server import app
+
+application = app
@@ -24,13 +24,15 @@ Used by:
 Persistence Boundry
 --------------------
     - All disk I/O (load/save/backup rotation) happens here.
-    - Writes use 'atomic_write()' with a module-wide '_save_lock' to seralize and writes
-    across threads and avoids partial/corrupt files.
+    - Writes use 'atomic_write()' (temp file + replace) to avoid partial/corrupt files.
+    - A single writer thread owns the disk; other threads only hand it encoded
+    snapshots (see 'save_items').
     
 Threading Model
 ----------------
-    - One background daemon thread ('autosave_loop') that periodically calls 'save_items'. It cooperates
-    via '_save_lock' and can be stopped with '__stop_event_'.
+    - One background daemon thread ('autosave_loop') that periodically calls 'save_items' when
+    '_dirty' is set (i.e. the REPL mutated 'items' since the last save). It only queues
+    the snapshot for the writer and can be stopped with '__stop_event_'.
     - The REPL runs on the main thread and all mutations to 'items' are done here.
     
 CLI surface
@@ -44,12 +46,18 @@ Usage
 
 import argparse
 import errno
-import json
+import functools
+import hashlib
+import heapq
+import mmap
 import os
-import tempfile
+import orjson
+import queue
 import threading
 import time
+from collections import Counter
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from colorama import init, Fore, Style
 from tabulate import tabulate
@@ -62,23 +70,59 @@ from collectory.analysis import (
     remove_item, 
     filter_by_category, 
     search_by_keyword,
-    get_category_distribution,
-    get_time_distribution
+    combined_distributions
 )
 from collectory import config
 
 # Initialize terminal color handling only once
 init(autoreset=True)
 
-# Single lock for full program serialized writing to disk
+# Serializes '_write_snapshot' (main file + backup + rotation bookkeeping).
+# While the writer thread runs it is the only holder, so this never blocks the
+# REPL; it only matters for inline saves made without a writer.
 _save_lock = threading.Lock()
 
 # stop autosave loop cleanly on exit with one last atomic save
 _stop_event = threading.Event()
 
+# Set by REPL mutations, cleared when a save starts; autosave skips clean ticks
+_dirty = threading.Event()
+
+# Bumped on every REPL mutation ('_mark_dirty'); keys caches of derived views
+_revision = 0
+_table_cache: Optional[Tuple[int, int, str]] = None  # (id(items), revision, text)
+
 # Timestamp format
 TIME_FMT = "%Y-%m-%d %H:%M:%S"
 
+# Temp files for 'atomic_write': new, exclusive, binary on Windows
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+# Distinct timestamps remembered by '_parse_time_or_none'
+TIME_CACHE_SIZE = 1 << 14
+
+# Collection files at least this large are parsed from a memory map
+MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+# Pending saves for the background writer (see 'start_writer'). Small on purpose:
+# a newer snapshot replaces a queued one instead of waiting behind it.
+_writer_q: "queue.Queue[Optional[_SaveJob]]" = queue.Queue(maxsize=2)
+_writer_thread: Optional[threading.Thread] = None
+# How often (seconds) a waiting 'save_items' checks that the writer is alive
+_WRITER_POLL = 0.5
+
+# Saves written since the last 'rotate_backups' pass (guarded by '_save_lock')
+_saves_since_rotate = 0
+
+# Main file -> (blake2b digest, durable, file stamp) of the last payload saved
+# there (guarded by '_save_lock'); identical re-saves are skipped while the file
+# is still exactly what we wrote ('_file_stamp')
+_last_saved: Dict[Path, Tuple[bytes, bool, Tuple[int, int, int]]] = {}
+
+# 'save_items' result for a skipped identical save. Truthy, so callers that only
+# check for failure treat it as success.
+UNCHANGED = "unchanged"
+
 def main():
     """ Top level CLI: parses args, loads data, starts autosave, runs REPL loop
     Flow:
@@ -105,6 +149,11 @@ def main():
     file_name = prompt_nonempty("Enter name to load: ")
     path = config.collection_path(file_name)
     items = load_items(path)
+    # (name, category) lookup for "Add item"; kept in step with every mutation
+    index = index_items(items)
+    
+    # --- Writer: all disk I/O for saves happens on this thread ---------
+    start_writer()
     
     # --- Autosave: background thread ----------------------------------
     # Periodically writes the current items list to disk + backup. Uses
@@ -127,23 +176,28 @@ def main():
                 category = prompt_nonempty("Enter item category: ")
                 quantity = prompt_positive_int("Quantity to add: ")
             
-                matches = [e for e in items 
-                       if e["name"].lower() == name.lower() 
-                       and e["category"].lower() == category.lower()
-                        ]
-                if matches:
-                    entry = matches[0]
+                entry = index.get((name.lower(), category.lower()))
+                if entry is not None:
                     increment_quantity(entry, quantity)
+                    _mark_dirty()
                     print_success(f"{quantity} added to '{name}'. New total: {entry['quantity']}")
                 else:
-                    create_new_item(name, items, category, quantity)
+                    entry = create_new_item(name, items, category, quantity)
+                    index[_index_key(entry)] = entry
+                    _mark_dirty()
                     print_success(f"Created new item '{name}' x {quantity}.")
                     
             elif choice == "2":
                 # Remove an item (by name) with a quantity 
                 target = prompt_nonempty( "Enter name of item to remove: ")
                 quantity = prompt_positive_int("Quantity to remove: ")
+                count = len(items)
                 success = remove_item(items, quantity, target)
+                if success:
+                    _mark_dirty()
+                    if len(items) < count:
+                        # An entry was dropped (rare): rebuild rather than track which
+                        index = index_items(items)
                 confirm_action(
                     success,
                     success_message = f"Removed {quantity} x {target}",
@@ -153,7 +207,9 @@ def main():
             elif choice == "3":
                 # Edit category for an item found by name
                 target  = prompt_nonempty("Enter name of item to re-categorize: ")
-                success = edit_category(items, target)
+                success = edit_category(items, target, index)
+                if success:
+                    _mark_dirty()
                 confirm_action(
                     success,
                     success_message = f"{target}'s category changed successfully.",
@@ -162,16 +218,22 @@ def main():
                 
             elif choice == "4":
                 # Display table of all items in terminal
-                show_table(items)
+                show_table(items, revision=_revision)
                 
             elif choice == "5":
                 # Save collection and rotate backups
+                _dirty.clear()
                 success = save_items(file_name, items)
-                confirm_action(
-                    success, 
-                    success_message = f"Collection saved to {file_name} and backed up successfully.",
-                    error_message = f"Save failed."
-                )
+                if not success:
+                    _dirty.set()
+                if success is UNCHANGED:
+                    print_success("No changes to save.")
+                else:
+                    confirm_action(
+                        success, 
+                        success_message = f"Collection saved to {file_name} and backed up successfully.",
+                        error_message = f"Save failed."
+                    )
                 
             elif choice == "6":
                 # Summarizes category and time distribution
@@ -219,125 +281,311 @@ def main():
         
         print(Fore.CYAN + "Saving before exit...")
         ok = save_items(file_name, items)
+        stop_writer()
         confirm_action(ok,
                        success_message = "Final save succeeded.",
                         error_message = "Final save FAILED")
         print("Have a great day!")
     
     
-def atomic_write(fname: Path, data: Any) -> None:
-    """Atomically write JSON to 'fname' using a temp file + replace.
+def _index_key(item: dict) -> Tuple[str, str]:
+    return item["name"].lower(), item["category"].lower()
+    
+def index_items(items: list) -> Dict[Tuple[str, str], dict]:
+    """Map '(name.lower(), category.lower())' to the first matching item.
+    
+    Backs the duplicate check in "Add item" with an O(1) lookup instead of a
+    scan that lowercases every entry. First match wins, like the scan did.
+    """
+    index: Dict[Tuple[str, str], dict] = {}
+    for item in items:
+        index.setdefault(_index_key(item), item)
+    return index
+    
+def encode_items(items: list) -> bytes:
+    """Serialize items to the on-disk JSON format (UTF-8, 2-space indent).
+    
+    Encoded once per save; the same bytes back both the main file and its backup.
+    orjson emits the same layout as 'json.dumps(indent=2, ensure_ascii=False)'
+    but runs in C and returns bytes directly.
+    """
+    return orjson.dumps(items, option=orjson.OPT_INDENT_2)
+    
+def atomic_write(fname: Path, payload: bytes, durable: bool = True) -> None:
+    """Atomically write pre-encoded JSON bytes to 'fname' using a temp file + replace.
     
     Atomic write protocol (POSIX-friendly):
         1) Create a temp file in the same directory as 'fname' (ensures
         'os.replace' is atomic on the same filesystem).
-        2) Dump JSON to the temp file and 'flush' + os.fsync' the descriptor.
+        2) Write 'payload' with raw 'os.write' calls (+ 'os.fsync' if 'durable').
         3) 'os.replace(tmp,fname)' to swap in the new file automatically.
+        4) If 'durable', fsync the parent directory so the rename itself persists.
+        
+    Without 'durable' the data is left to kernel writeback: a crash may lose the
+    latest write, but the rename still guarantees no torn/partial file.
         
     Concurrency
-        - Protected by a module-wide '_save_lock' to avoid overlapping writes
+        - Not locked: callers serialize saves ('_write_snapshot' under '_save_lock').
+        Temp names are unique per pid/ns, so a stray concurrent call can't clash.
     Args:
         fname (Path): Target JSON file path
-        data (Any): JSON-serializable content. 
+        payload (bytes): Encoded file content (see 'encode_items').
+        durable (bool): fsync before the rename (user-visible saves).
     """
     fname.parent.mkdir(parents=True, exist_ok=True)
     
     # Create temp in the same directory to ensure atomic rename/replace
     tmp_path: Path | None = None
     
-    with _save_lock:
+    try:
+        # pid + ns keeps concurrent writers apart; O_EXCL refuses to reuse a name
+        candidate = fname.with_name(f"{fname.name}.{os.getpid()}.{time.time_ns()}.tmp")
+        fd = os.open(str(candidate), _TMP_FLAGS, 0o600)
+        tmp_path = candidate  # ours now: cleaned up on failure below
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=str(fname.parent),
-                prefix=fname.name + ".",
-                suffix=".tmp",
-                delete=False,
-            ) as tmp:
-                # Write JSON with UTF-8 and pretty indent while keeping unicode characters
-                json.dump(data, tmp, indent=2, ensure_ascii=False)
-                # Make sure data is flushed to disk before replacing
-                tmp.flush()
-                os.fsync(tmp.fileno())
-                tmp_path = Path(tmp.name)
-            
-            # Atomic swap: on success, either old or new exists, and no partial file
-            os.replace(str(tmp_path), str(fname))
-        
-        except PermissionError:
-            print_error("Permission denied: cannot write data file.")
-            # Best-effort cleanup of temp
-            if tmp_path and tmp_path.exists():
-                try:
-                    tmp_path.unlink()
-                except Exception:
-                    pass
-            raise
-        
-        except OSError as e:
-            if e.errno == errno.ENOSPC:
-                print_error("No space left on device: save failed")
-            else:
-                print_error(f"Filesystem error during save: {e}")
-            if tmp_path and tmp_path.exists():
-                try:
-                    tmp_path.unlink()
-                except Exception:
-                    pass
-            raise
+            # Unbuffered: the payload is already bytes, hand it straight to the kernel
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            if durable:
+                # Make sure data is on disk before replacing
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        
+        # Atomic swap: on success, either old or new exists, and no partial file
+        os.replace(str(tmp_path), str(fname))
+        if durable:
+            _fsync_dir(fname.parent)
     
+    except PermissionError:
+        print_error("Permission denied: cannot write data file.")
+        # Best-effort cleanup of temp
+        if tmp_path and tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except Exception:
+                pass
+        raise
     
+    except OSError as e:
+        if e.errno == errno.ENOSPC:
+            print_error("No space left on device: save failed")
+        else:
+            print_error(f"Filesystem error during save: {e}")
+        if tmp_path and tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except Exception:
+                pass
+        raise
+    
+def _fsync_dir(path: Path) -> None:
+    """fsync a directory so a completed rename inside it survives a crash.
+    
+    Best effort: directories can't be opened this way on Windows (and some
+    filesystems reject fsync on them), in which case this is a no-op.
+    """
+    try:
+        dfd = os.open(str(path), os.O_RDONLY | os.O_DIRECTORY)
+    except (OSError, AttributeError):
+        return
+    try:
+        os.fsync(dfd)
+    except OSError:
+        pass
+    finally:
+        os.close(dfd)
+        
 def autosave_loop(file_name: str, items: list) -> None:
     """Background loop that periodically saves the in-memory items.
     
     Respects:
         - feature flag 'config.AUTOSAVE_ENABLED'
         - sleeps for 'config.AUTOSAVE_INTERVAL' seconds.
+        - only writes when '_dirty' is set, so idle sessions don't touch the disk.
         
     Threading: 
-        - Runs forever as a daemon thread (no stop event).
-        - SYnchronizes with manual saves via '_save_lock'.
+        - Runs as a daemon thread until '_stop_event' is set ('request_shutdown').
+        - Never touches the disk itself: snapshots are queued for the writer thread.
         
     Args:
         file_name: Logical collection name (used to derive file paths).
         items: The in-memory list of item dicts to persist.
     """
-    while not _stop_event.wait(config.AUTOSAVE_INTERVAL):
-        if config.AUTOSAVE_ENABLED:
-            save_items(file_name, items)
+    # Settings are fixed for the session: read them once, not every tick
+    interval = config.AUTOSAVE_INTERVAL
+    enabled = config.AUTOSAVE_ENABLED
+    while not _stop_event.wait(interval):
+        if enabled and _dirty.is_set():
+            # Clear before saving so edits made mid-save mark the next tick dirty
+            _dirty.clear()
+            # Fire and forget: a failed background write re-marks '_dirty'
+            if not save_items(file_name, items, durable=False, wait=False):
+                _dirty.set()
             
 def request_shutdown():
     _stop_event.set()
+    
+def _mark_dirty() -> None:
+    """Record a REPL mutation: schedule an autosave and invalidate cached views."""
+    global _revision
+    _revision += 1
+    _dirty.set()
+    
+    
+class _SaveJob:
+    """A queued save: one encoded snapshot plus a handle to wait on its result."""
+    
+    __slots__ = ("file_name", "payload", "durable", "ok", "done", "superseded")
+    
+    def __init__(self, file_name: str, payload: bytes, durable: bool):
+        self.file_name = file_name
+        self.payload = payload
+        self.durable = durable
+        self.ok = False
+        self.done = threading.Event()
+        self.superseded: List["_SaveJob"] = []
+        
+    def absorb(self, stale: "_SaveJob") -> None:
+        """Take over 'stale' (never written): its waiters get this job's result."""
+        self.durable = self.durable or stale.durable
+        self.superseded.append(stale)
+        
+    def finish(self, ok: bool | str) -> None:
+        for job in (self, *self.superseded):
+            job.ok = ok
+            job.done.set()
+            
+            
+def start_writer() -> None:
+    """Start the background writer thread (no-op if it's already running).
+    
+    While it runs, 'save_items' only encodes and enqueues; the writer does the
+    atomic write, backup and rotation. Callers never block on the disk unless
+    they ask for the result.
+    """
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    _writer_thread = threading.Thread(
+        target=_writer_loop, name="collectory-writer", daemon=True
+    )
+    _writer_thread.start()
+    
+def stop_writer(timeout: Optional[float] = None) -> None:
+    """Finish queued saves, then stop the writer thread."""
+    global _writer_thread
+    if _writer_thread is None:
+        return
+    _writer_q.put(None)  # sentinel goes behind any pending jobs
+    _writer_thread.join(timeout)
+    _writer_thread = None
+    
+def _writer_loop() -> None:
+    while True:
+        job = _writer_q.get()
+        if job is None:
+            return
+        try:
+            ok = _write_snapshot(job.file_name, job.payload, job.durable)
+        except Exception as e:
+            # Never die with a job in hand: its waiter would block forever
+            print_error(f"Save failed: {e}")
+            ok = False
+        if not ok:
+            # Let the next autosave tick retry
+            _dirty.set()
+        job.finish(ok)
+        
+def _enqueue(job: _SaveJob) -> None:
+    """Queue 'job' for the writer; latest write wins when the queue is full.
+    
+    A session saves a single collection, so a queued job that hasn't started
+    yet is strictly older than 'job' and can be dropped in its favour.
+    """
+    while True:
+        try:
+            _writer_q.put_nowait(job)
+            return
+        except queue.Full:
+            pass
+        try:
+            stale = _writer_q.get_nowait()
+        except queue.Empty:
+            continue  # the writer just took one; retry the put
+        if stale is None:
+            # Shutting down: keep the sentinel behind us
+            _writer_q.put(job)
+            _writer_q.put(None)
+            return
+        job.absorb(stale)
             
-def show_table(items: list) -> None:
+# show_table columns rendered verbatim (all but Quantity)
+_TEXT_COLUMNS = [0, 1, 2, 4]
+
+def show_table(items: list, revision: Optional[int] = None) -> None:
     """Print items as a grid table, otherwise notify collection is empty.
     
     Columns: ID, Name, Category, Quantity, Time
     
     Args:
         items: The current collection (list of dicts with the core fields).
+        revision: '_revision' the caller saw for 'items'. When given, the rendered
+        table is reused until the next mutation (menu 4 on an unchanged collection).
+        Leave it None for one-off lists such as filter/search results.
         
     Side Effects:
         Prints to stdout.
     """
+    global _table_cache
     if not items:
         print_error("No items in collection.")
         return
     
-    rows = [
-        [item.get("id", ""), item["name"], item["category"], item["quantity"], item["time"]]
-        for item in items
-    ]
+    if revision is not None and _table_cache is not None and _table_cache[:2] == (id(items), revision):
+        print(_table_cache[2])
+        return
+    
+    # Lazy rows: tabulate makes its own list, so don't build a second one here
+    fields = itemgetter("name", "category", "quantity", "time")
+    rows = ((item.get("id", ""), *fields(item)) for item in items)
     headers = ["ID", "Name", "Category", "Quantity", "Time"]
-    print(tabulate(rows, headers=headers, tablefmt="grid"))
+    # Only Quantity is numeric: skip tabulate's per-cell number sniffing on
+    # the text columns (it would also print a name like "007" as 7)
+    text = tabulate(rows, headers=headers, tablefmt="grid", disable_numparse=_TEXT_COLUMNS)
+    if revision is not None:
+        _table_cache = (id(items), revision, text)
+    print(text)
+        
+def read_json(path: Path) -> Any:
+    """Parse the JSON document at 'path' with orjson.
+    
+    Small files are read into bytes. Files of 'MMAP_THRESHOLD' bytes or more are
+    memory-mapped and handed to orjson as a memoryview, so the page cache is
+    parsed in place instead of being copied into a second bytes buffer first.
+    
+    Raises:
+        OSError: If the file can't be opened/read.
+        orjson.JSONDecodeError: If the content isn't valid UTF-8 JSON.
+    """
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0 or size < MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
         
 def load_items(path: Path) -> list:
     """Load items from JSON file.
 
     Behavior:
         - If the file doesn't exist: return [] and warn.
-        - If JSON is corrupt: move the bad file aside with a timestamp and return [].
+        - If JSON is corrupt (or not valid UTF-8): move the bad file aside with a timestamp and return [].
         - If JSON is valid but not a list: warn and return [].
         
     Args:
@@ -354,8 +602,7 @@ def load_items(path: Path) -> list:
         the file is missing or damaged.
     """
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data: Any = json.load(f)
+        data: Any = read_json(path)
         if not isinstance(data, list):
             print_error(f"Data at {path} is not a JSON list. Starting with an empty collection.")
             return []
@@ -365,7 +612,7 @@ def load_items(path: Path) -> list:
         print_error(f"No file found at {path!s}. Starting with an empty collection.")
         return []
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         # Quarantine corrupt file so a fresh one can be created
         ts = datetime.now().strftime("%Y%m%dT%H%M%S")
         corrupt = path.with_name(f"{path.stem}_corrupt_{ts}{path.suffix}")
@@ -381,45 +628,134 @@ def load_items(path: Path) -> list:
         print_error(f"Permission denied reading {path}.")
         return []
         
-def save_items(file_name: str, items: list) -> bool:
+def save_items(
+    file_name: str, items: list, durable: bool = True, wait: bool = True
+) -> bool | str:
     """Persist current items and write a timestamped backup. Rotates old backups afterwards.
 
-    Protocol (under '_save_lock'):
-        1) Write the main file '<file_name>.json' automatically.
-        2) Write a timestamped backup '<file_name>_<YYYYmmddTHHMMSS><suffix>.json'.
-        3) Prune old backups keeping the newest 'config.MAX_BACKUPS'.
+    Protocol:
+        1) Encode items once, in the caller's thread (this is the snapshot).
+        2) Write the main file '<file_name>.json' atomically.
+        3) Write the same bytes to a timestamped backup
+        '<file_name>_<YYYYmmddTHHMMSS>_<ns><suffix>.json' (its own file, so
+        later in-place edits of the main file can't change it).
+        4) Prune old backups keeping the newest 'config.MAX_BACKUPS'. Non-durable
+        saves only prune every 'config.BACKUP_ROTATE_EVERY' saves.
+        
+    Steps 2-4 run on the writer thread when one is running ('start_writer'),
+    otherwise inline.
         
     Args:
         file_name: Logical collection name (determines filenames).
         items: in-memory list of item dicts.
+        durable: fsync the main file before publishing it. Autosave passes False
+        (the next tick rewrites anyway), explicit and shutdown saves keep True.
+        wait: block until the write finished. With 'wait=False' the save is only
+        queued and True means "accepted"; failures re-mark '_dirty'.
         
     Returns:
-        True on success (main save + backup + rotation), False otherwise. 
+        True on success (main save + backup + rotation), 'UNCHANGED' if the
+        snapshot was identical to the last save and nothing was written, False
+        otherwise.
         
     Side Effects:
         Writes/renames/deletes files in 'config.DATA_DIR'
     """
+    try:
+        payload = encode_items(items)
+    except Exception as e:
+        print_error(f"Save failed: {e}")
+        return False
+    
+    if _writer_thread is None or not _writer_thread.is_alive():
+        return _write_snapshot(file_name, payload, durable)
+    
+    job = _SaveJob(file_name, payload, durable)
+    _enqueue(job)
+    if not wait:
+        return True
+    while not job.done.wait(_WRITER_POLL):
+        writer = _writer_thread
+        if writer is None or not writer.is_alive():
+            # The writer is gone (crashed, or torn down at exit) and won't
+            # finish this job: write it here instead of waiting forever.
+            return _write_snapshot(file_name, payload, durable)
+    return job.ok
+    
+def _backup_stamp() -> str:
+    """Backup timestamp 'YYYYmmddTHHMMSS_<ns>' from a single clock read.
+    
+    The zero-padded nanoseconds keep saves within the same second apart
+    (they used to overwrite each other) and names still sort chronologically.
+    """
+    ns = time.time_ns()
+    seconds, fraction = divmod(ns, 1_000_000_000)
+    return f"{time.strftime('%Y%m%dT%H%M%S', time.localtime(seconds))}_{fraction:09d}"
+    
+def _file_stamp(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of 'path', or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+def _write_snapshot(file_name: str, payload: bytes, durable: bool) -> bool | str:
+    """Write an encoded snapshot + backup and rotate (steps 2-4 of 'save_items').
+    
+    Skipped (returns 'UNCHANGED') when 'payload' is byte-for-byte what the last
+    successful save put in the same file and that file is untouched since
+    (same mtime, size and inode: a GUI save or an editor rewriting it in place
+    forces a real write). A durable save still rewrites content that so far
+    was only written lazily.
+    """
     with _save_lock:
         data_dir = config.DATA_DIR
         base = data_dir / f"{file_name}.json"
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        last = _last_saved.get(base)
+        if (
+            last is not None
+            and last[0] == digest
+            and (last[1] or not durable)
+            and last[2] == _file_stamp(base)
+        ):
+            return UNCHANGED
     
         try:
-            atomic_write(base, items)
-            ts = datetime.now().strftime("%Y%m%dT%H%M%S")
-            backup = data_dir / f"{file_name}_{ts}{config.BACKUP_SUFFIX}.json"
-            atomic_write(backup, items)
-        
+            atomic_write(base, payload, durable=durable)
+            backup_name = f"{file_name}_{_backup_stamp()}{config.BACKUP_SUFFIX}.json"
+            backup = data_dir / backup_name
+            # Same payload, no second encode. Not a hardlink: the GUI's Save and
+            # editors rewrite the main file in place, which would alter the backup.
+            atomic_write(backup, payload, durable=False)
+            stamp = _file_stamp(base)
+            if stamp is None:
+                _last_saved.pop(base, None)
+            else:
+                _last_saved[base] = (digest, durable, stamp)
+            
+            # Directory scans are amortized: autosaves only prune every
+            # BACKUP_ROTATE_EVERY saves; durable (explicit/final) saves always do.
+            global _saves_since_rotate
+            _saves_since_rotate += 1
+            if not durable and _saves_since_rotate < config.BACKUP_ROTATE_EVERY:
+                return True
+            _saves_since_rotate = 0
             return rotate_backups(data_dir, file_name, keep=config.MAX_BACKUPS)
         except Exception as e:
             print_error(f"Save failed: {e}")
             return False
         
-def edit_category(items: list, target: str) -> bool:
+def edit_category(items: list, target: str, index: Optional[dict] = None) -> bool:
     """Update the 'category' field of the first item whose name matches 'target'.
     
     Args:
         items: the collection (mutated in place).
         target: name to match (case-insensitive).
+        index: optional 'index_items(items)' to keep in step. Only the edited
+        entry is re-keyed, so no rebuild (and no lowercasing of every item) is
+        needed afterwards.
         
     Returns:
         True if the item was found and updated, False otherwise
@@ -428,12 +764,21 @@ def edit_category(items: list, target: str) -> bool:
         Prompts the user for the new category if a match is found.
     
     """
-    for item in items:
-        if item['name'].lower() == target.lower():
-            new_category = prompt_nonempty(f"Enter new category for {target}: ")
-            item['category'] = new_category
-            return True
-    return False
+    target_lc = target.lower()
+    # Early-exit scan in list order: the index's key order drifts as entries are
+    # re-keyed, so it can't tell which same-named item comes first.
+    item = next((item for item in items if item['name'].lower() == target_lc), None)
+    if item is None:
+        return False
+    new_category = prompt_nonempty(f"Enter new category for {target}: ")
+    if index is not None:
+        old_key = _index_key(item)
+        if index.get(old_key) is item:
+            del index[old_key]
+    item['category'] = new_category
+    if index is not None:
+        index.setdefault(_index_key(item), item)
+    return True
 
 def items_per_category(items):
     """Print a count of *items* per category (not quantities of items themselves).
@@ -449,20 +794,14 @@ def items_per_category(items):
         Use 'get_category_distribution' for quantity totals.
     
     """
-    categories_count = {}
-    for item in items:
-        category = item['category']
-        if category not in categories_count:
-            categories_count[category] = 1
-        else:
-            categories_count[category] += 1
+    categories_count = Counter(item['category'] for item in items)
     if not categories_count:
         print_error("Items per category: none")
         return False
     else: 
         print_success("Items per category: ")
-        sorted_categories = sorted(categories_count.items(), key=lambda x: x[1], reverse=True)
-        for category, count in sorted_categories:
+        # most_common(): count desc, ties in first-seen order (as the stable sort was)
+        for category, count in categories_count.most_common():
             print(f"    {category}: {count}")
         return True
             
@@ -476,13 +815,22 @@ def show_summary(items):
     
     """
     print(f"Total items: {len(items)}")
-    for category, quantity in get_category_distribution(items).items():
+    by_category, by_time = combined_distributions(items)
+    for category, quantity in by_category.items():
         print(f"    {category}: {quantity}")
-    for period, quantity in get_time_distribution(items).items():
+    for period, quantity in by_time.items():
         print(f"    {period}: {quantity}")
         
+@functools.lru_cache(maxsize=TIME_CACHE_SIZE)
 def _parse_time_or_none(s: str) -> Optional[datetime]:
     """Parese 's' using TIME_FMT, returning None on failure (non-throwing).
+    
+    Memoized: the same timestamps are re-parsed every time the summary is
+    shown. datetimes are immutable, so sharing is safe.
+    
+    The canonical 19-char 'YYYY-mm-dd HH:MM:SS' layout (everything we write) is
+    sliced into ints directly; anything else, e.g. unpadded fields that
+    'strptime' also accepts, falls back to 'strptime' so results are unchanged.
 
     Args:
         s: a timestamp string in the expected TIME_FMT.
@@ -491,6 +839,12 @@ def _parse_time_or_none(s: str) -> Optional[datetime]:
         A datetime if parsing succeeds, otherwise None.
     """
     try:
+        if (len(s) == 19 and s[4] == "-" and s[7] == "-" and s[10] == " "
+                and s[13] == ":" and s[16] == ":"):
+            digits = s[:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:]
+            if digits.isascii() and digits.isdigit():
+                return datetime(int(s[:4]), int(s[5:7]), int(s[8:10]),
+                                int(s[11:13]), int(s[14:16]), int(s[17:]))
         return datetime.strptime(s, TIME_FMT)
     except Exception:
         return None
@@ -510,26 +864,42 @@ def oldest_newest(items: list) -> None:
         print_error("No items in system to display.")
         return
     
-    # Precompute (parsed_dt, item) pairs, skipping any with bad/missing time.
-    parsed: List[Tuple[datetime, Dict[str, Any]]] = []
+    # One streaming pass for both ends, skipping bad/missing times. Strict
+    # comparisons keep the first item on ties, same as min()/max() did.
+    # NOTE: Consider formatting date output later
+    oldest_datetime = newest_datetime = None
+    oldest_item = newest_item = None
     for item in items:
-        time = item.get("time")
-        if isinstance(time, str):
-            datetime = _parse_time_or_none(time)
-            if datetime is not None:
-                parsed.append((datetime, item))
+        raw = item.get("time")
+        if not isinstance(raw, str):
+            continue
+        dt = _parse_time_or_none(raw)
+        if dt is None:
+            continue
+        if oldest_datetime is None:
+            oldest_datetime, oldest_item = newest_datetime, newest_item = dt, item
+        elif dt < oldest_datetime:
+            oldest_datetime, oldest_item = dt, item
+        elif dt > newest_datetime:
+            newest_datetime, newest_item = dt, item
                 
-    if not parsed:
+    if oldest_item is None:
         print_error("No valid timestamps found on items.")
         return
     
-    # NOTE: update for consistency
-    oldest_datetime, oldest_item = min(parsed, key=lambda p: p[0]) # NOTE: Consider formatting date output later 
-    newest_datetime, newest_item = max(parsed, key=lambda p: p[0])
-    
     print(f"Oldest item: {oldest_item.get('name', '(unknown)')}\nDate/Time: {oldest_item.get('time', '')}\n")
     print(f"Newest item: {newest_item.get('name', '(unknown)')}\nDate/Time: {newest_item.get('time', '')}\n")
         
+def _stamp_key(stamp: str) -> Tuple[str, int]:
+    """Sort key for a backup stamp, old 'YYYYmmddTHHMMSS' or 'YYYYmmddTHHMMSS_<ns>'.
+    
+    Compared as text, an old-style name from the same second would sort after
+    the new ones (the suffix follows where '_<ns>' would be); here it counts as
+    0 ns into that second.
+    """
+    seconds, _, ns = stamp.partition("_")
+    return seconds, int(ns) if ns.isdigit() else 0
+    
 def rotate_backups(data_dir: Path, prefix: str, keep: int) -> bool:
     """Keep only the newest 'keep' backups for the given collection prefix.
     
@@ -545,19 +915,35 @@ def rotate_backups(data_dir: Path, prefix: str, keep: int) -> bool:
         '{prefix}_*{config.BACKUP_SUFFIX}.json'
         
     Notes:
-        - Files are sorted by modification time (newest first).
+        - Files are ordered by the timestamp embedded in their name (newest
+        first, see '_stamp_key'), so no per-file 'stat' is needed. Only names
+        whose stamp part starts with a digit count as backups.
+        - One 'os.scandir' pass with plain prefix/suffix checks (no fnmatch).
         - Failures to delete are reported but not raised.
     """
-    pattern = f"{prefix}_*{config.BACKUP_SUFFIX}.json"
-    backups = sorted(
-        data_dir.glob(pattern),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True
-    )
+    head = f"{prefix}_"
+    tail = f"{config.BACKUP_SUFFIX}.json"
+    start, end = len(head), -len(tail)
+    with os.scandir(data_dir) as it:
+        backups = [
+            entry.name
+            for entry in it
+            if entry.name.startswith(head)
+            and entry.name.endswith(tail)
+            and entry.name[start:end][:1].isdigit()
+            and entry.is_file()
+        ]
+    if len(backups) <= keep:
+        return True
+    # Only the newest 'keep' need ordering: O(n log keep) instead of a full sort
+    newest = set(heapq.nlargest(keep, backups, key=lambda n: _stamp_key(n[start:end])))
     success = True
-    for old in backups[keep:]:
+    for name in backups:
+        if name in newest:
+            continue
+        old = os.path.join(data_dir, name)
         try:
-            old.unlink()
+            os.unlink(old)
             print_success(f"Pruned old backup : {old}")
         except Exception as e:
             print_error(f"Could not delete {old}: {e}")
@@ -576,8 +962,9 @@ def prompt_positive_int(prompt: str) -> int:
     User Experience:
         - On invalid input, prints an error and re-prompts for positive number.
     """
+    colored = Fore.YELLOW + prompt  # built once, not on every retry
     while True:
-        resp = input(Fore.YELLOW + prompt).strip()
+        resp = input(colored).strip()
         try:
             val = int(resp)
             if val > 0:
@@ -596,8 +983,9 @@ def prompt_nonempty(prompt: str) -> str:
     Returns:
         The user's response (stripped), guaranteed non-empty.
     """
+    colored = Fore.YELLOW + prompt  # built once, not on every retry
     while True:
-        resp = input(Fore.YELLOW + prompt).strip()
+        resp = input(colored).strip()
         if resp:
             return resp
         print_error("Input cannot be blank.")
@@ -614,24 +1002,26 @@ def print_error(text: str) -> None:
     """Print a red error message."""
     print(Fore.RED + text)
     
+# Built once: the menu is reprinted on every REPL turn
+_MENU = (
+  Fore.CYAN + Style.BRIGHT +
+  "\n=== Curation ===\n" + 
+  Fore.YELLOW +
+  "1) Add Item\n"
+  "2) Remove Item\n"
+  "3) Edit Category\n"
+  "4) View Items\n"
+  "5) Save Collection\n"
+  "6) Summary\n"
+  "7) Filter by Category\n"
+  "8) Search by Keyword\n"
+  "9) Quit\n" +
+  Style.RESET_ALL
+)
+
 def display_menu() -> None:
     """Render the interactive menu."""
-    menu = (
-      Fore.CYAN + Style.BRIGHT +
-      "\n=== Curation ===\n" + 
-      Fore.YELLOW +
-      "1) Add Item\n"
-      "2) Remove Item\n"
-      "3) Edit Category\n"
-      "4) View Items\n"
-      "5) Save Collection\n"
-      "6) Summary\n"
-      "7) Filter by Category\n"
-      "8) Search by Keyword\n"
-      "9) Quit\n" +
-      Style.RESET_ALL
-    )
-    print(menu)
+    print(_MENU)
     
 def confirm_action(ok: bool, success_message: str, error_message: str | None = None) -> None:
     """Print success/error based on a boolean outcome.
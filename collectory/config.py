@@ -21,7 +21,7 @@ Persistence boundry
 Threading
 ---------
     - No threading primitives are defined here, constants are read concurrently.
-    Writes to files are guarded elsewhere (e.g. CLI's '_save_lock').
+    Writes to files are serialized elsewhere (the CLI's writer thread).
     
 Notes
 ------
@@ -61,6 +61,10 @@ BACKUP_SUFFIX = "_backup"
 # Maxiumum number of most-recent backups to retain during rotation.
 MAX_BACKUPS = 3 # Three backup saves
 
+# Autosaves prune old backups only every N saves (explicit saves always prune),
+# so up to MAX_BACKUPS + N - 1 backups may exist between rotations.
+BACKUP_ROTATE_EVERY = 4
+
 # Autosave feature flags (consumed by the CLI's autosave loop).
 AUTOSAVE_ENABLED = True
 AUTOSAVE_INTERVAL = 300 # 5 min delay
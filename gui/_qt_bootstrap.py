@@ -0,0 +1,41 @@
+"""
+Qt plugin path setup shared by the GUI entry points.
+
+Responsibilities
+----------------
+    - Point Qt at PySide6's bundled plugin directories (e.g. 'platforms/libqcocoa',
+    'platforms/qwindows', 'platforms/libqxcb') before a QApplication is created.
+    - Do it once per process: the paths are computed on the first call and later
+    calls are no-ops, so importing several entry points never resets Qt's
+    library paths twice.
+"""
+
+from __future__ import annotations
+
+import os
+
+import PySide6
+from PySide6.QtCore import QCoreApplication
+
+_DONE = False
+
+
+def configure_plugin_paths() -> None:
+    """Set the Qt plugin environment variables and library paths (idempotent)."""
+    global _DONE
+    if _DONE:
+        return
+    
+    # Compute PySide6's plugin directories, then set environment variables so that
+    # Qt can discover platform plugins reliably.
+    pyside_dir = os.path.dirname(PySide6.__file__)
+    plugin_dir = os.path.join(pyside_dir, "Qt", "plugins")
+    platforms_dir = os.path.join(plugin_dir, "platforms")
+    
+    # Set defaults only if not already provided by the environment/packager.
+    os.environ.setdefault("QT_PLUGIN_PATH", plugin_dir)
+    os.environ.setdefault("QT_QPA_PLATFORM_PLUGIN_PATH", platforms_dir)
+    
+    # Also update Qt's internal library search paths at runtime
+    QCoreApplication.setLibraryPaths([plugin_dir])
+    _DONE = True
@@ -0,0 +1,86 @@
+"""
+Table model for the main window's item view (PySide6).
+
+Responsibilities
+----------------
+    - Expose a list of item dicts to 'QTableView' as five read-only columns
+    (ID/Name/Category/Quantity/Timestamp).
+    - Produce cell text on demand in 'data()', so only rows the view actually
+    paints are converted. Replacing the rows is a single model reset instead
+    of allocating a 'QStandardItem' per cell.
+    - Convert each painted row once: its five display strings are kept in a
+    tuple, so repaints (scrolling, resizing) are a plain tuple index.
+
+Relationships
+-------------
+    - Owned by 'gui.main_window.MainWindow', which decides which rows (all items
+    or a filtered subset) the model shows.
+
+Thread/UI
+---------
+    - Must be used on the Qt GUI thread like any model attached to a view.
+"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class ItemsTableModel(QAbstractTableModel):
+    """Read-only table model over a list of item dicts.
+
+    The model keeps its own list of row references (and their cached display
+    text): callers mutating their source list or items afterwards must call
+    'set_rows' again to show the change.
+    """
+
+    HEADERS = ("ID", "Name", "Category", "Quantity", "Timestamp")
+    KEYS = ("id", "name", "category", "quantity", "time")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[dict] = []
+        # Display strings per row, filled the first time the row is painted
+        self._text: list[tuple[str, ...] | None] = []
+
+    def set_rows(self, rows: list[dict]) -> None:
+        """Replace every row with 'rows' (one reset notification)."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._text = [None] * len(self._rows)
+        self.endResetModel()
+
+    def append_rows(self, rows: list[dict]) -> None:
+        """Append 'rows' at the end (one insert notification; existing rows untouched)."""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._text.extend([None] * len(rows))
+        self.endInsertRows()
+
+    def rows(self) -> list[dict]:
+        """The items currently shown, in display order."""
+        return self._rows
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        text = self._text[row]
+        if text is None:
+            item = self._rows[row]
+            text = self._text[row] = tuple(str(item[key]) for key in self.KEYS)
+        return text[index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
@@ -5,8 +5,8 @@ Curation GUI bootstrap and Qt plugin path setup.
 
 Responsibilites
 ---------------
-    - Configure Qt plugin search paths at runtime so PySide6 can locate platform
-    plugins (e.g. 'platforms/libqcocoa', 'platforms/qwindows', 'platforms/libqxcb').
+    - Configure Qt plugin search paths at runtime (via 'gui._qt_bootstrap') so
+    PySide6 can locate platform plugins.
     - Create and run the QApplication, show the MainWindow, and exit with the app code.
     
 Threading/UI
@@ -14,24 +14,12 @@ Threading/UI
     executed from the main process only.
 """
 
-import os
 import sys
-import PySide6
-from PySide6.QtCore import QCoreApplication
 
-# --- Qt plugin path configuration -------------------------------------------------------
-# Compute PySide6's plugin directories, then set enviroment, variables so that Qt can discover
-# platform plugins reliably.
-pyside_dir = os.path.dirname(PySide6.__file__)
-plugin_dir = os.path.join(pyside_dir, "Qt", "plugins")
-platforms_dir = os.path.join(plugin_dir, "platforms")
+from gui._qt_bootstrap import configure_plugin_paths
 
-# Set defaults only if not already provided by the enviroment/packager.
-os.environ.setdefault("QT_PLUGIN_PATH", plugin_dir)
-os.environ.setdefault("QT_QPA_PLATFORM_PLUGIN_PATH", platforms_dir)
-
-# Also update Qt's internal library search paths at runtime
-QCoreApplication.setLibraryPaths([plugin_dir])
+# Qt plugin paths must be configured before the QApplication exists.
+configure_plugin_paths()
 
 from PySide6.QtWidgets import QApplication
 from gui.main_window import MainWindow
@@ -13,7 +13,8 @@ Responsibilities
 Relationships
 -------------
 Depends on:
-    - 'api.services' (optional online source via 'get_all_items()').
+    - 'api.services' (optional online source via 'get_all_items()'), imported
+    lazily on first Refresh/Export so startup doesn't load the API stack.
     - 'gui.add_item_dialog.AddItemDialog' (modal item creation).
     - Domain helper 'collectory.collector.create_new_item (pure create).
     
@@ -21,12 +22,13 @@ Persistence boundry
 -------------------
     - JSON Open/Save and CSV Import/Export occur here via standard dialogs.
     - API reads via 'services.get_all_items()' (if available).
-    - no background threads, all operations run on the GUI thread.
+    - The API fetch runs on 'QThreadPool'; file dialogs and file I/O stay on the GUI thread.
     
 Thread/UI
     - All slots and UI updates must run on the Qt GUI thread.
-    - Long-running I/O is synchronous here (OK for small collections, consider moving
-    to a worker with signals/slots if needed).
+    - Refresh hands the fetch to a '_FetchRunnable'; results come back through
+    '_FetchSignals' (queued to the GUI thread) and only then touch widgets.
+    - File I/O is synchronous here (OK for small collections).
     
 Data model expectation
 ----------------------
@@ -39,34 +41,72 @@ Each item is a dict with keys:
 """
 
 import sys
-import api.services as services
 import csv
+from collections import OrderedDict
+from contextlib import contextmanager
 from PySide6.QtCore import Slot
 API_BASE = "http://localhost:5000"
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QAction, QStandardItemModel, QStandardItem
+# Quiet period after the last keystroke before the search re-filters
+SEARCH_DEBOUNCE_MS = 200
+
+# Recent (category, search) results kept for instant re-filtering
+FILTER_CACHE_SIZE = 16
+
+# Write buffer for CSV export (fewer, larger writes on big collections)
+EXPORT_BUFFER = 1 << 20
+
+# How long (ms) an error stays in the status bar; the full text goes to the error log
+ERROR_STATUS_MS = 5000
+
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QToolBar, QTableView, 
     QStatusBar, QVBoxLayout, QWidget, QDialog, QMenu,
-    QMessageBox, QFileDialog, QLineEdit, QComboBox
+    QFileDialog, QLineEdit, QComboBox, QHeaderView, QPlainTextEdit, QDialogButtonBox
 )
 
 from gui.add_item_dialog import AddItemDialog
+from gui.items_model import ItemsTableModel
 
 from datetime import datetime
 from collectory.collector import create_new_item # domain creation helper
+from collectory.collector import encode_items, read_json # on-disk JSON format
 
-import json
 from pathlib import Path
 
+class _FetchSignals(QObject):
+    """Carries a background fetch's outcome back to the GUI thread."""
+    finished = Signal(object)
+    failed = Signal(str)
+    
+    
+class _FetchRunnable(QRunnable):
+    """Run 'services.get_all_items()' on a pool thread and report via signals."""
+    
+    def __init__(self, signals: _FetchSignals):
+        super().__init__()
+        self.signals = signals
+        
+    def run(self):
+        try:
+            from api import services  # deferred: only needed once Refresh is used
+            
+            items = services.get_all_items()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(items)
+        
+        
 class MainWindow(QMainWindow):
     """Primary application window hosting the item table and toolbar.
     
     UI Composition
     ---------------
         - QToolBar with File menu, Add Item, search box, category combo, Refresh action.
-        - QTableView backed by QStandardItemModel (5 columns).
+        - QTableView backed by 'ItemsTableModel' (5 columns, text built on demand).
         - QStatusBar for ephemeral feedback.
         
     State
@@ -88,6 +128,15 @@ class MainWindow(QMainWindow):
         
         # Backing store for the current sessions data
         self._items: list[dict] = []
+        # (name.lower(), category.lower()) per item, parallel to '_items' ('_lowered')
+        self._index: list[tuple[str, str]] = []
+        # category.lower() -> ascending positions in '_items', kept in step with '_index'
+        self._by_category: dict[str, list[int]] = {}
+        # (item count, category_lc, needle, matching positions) of the last
+        # filter pass; reused to narrow while typing ('apply_filters')
+        self._last_filter: tuple | None = None
+        # (item count, category_lc, needle) -> matching positions, LRU order
+        self._filter_cache: OrderedDict[tuple, list[int]] = OrderedDict()
         
         # -- Toolbar and File menu -------------------------------------------------------
         toolbar = QToolBar("Main Toolbar")
@@ -119,9 +168,15 @@ class MainWindow(QMainWindow):
         self.category_combo = QComboBox(self)
         self.category_combo.addItem("All")
         toolbar.addWidget(self.category_combo)
-        
-        # Filter triggers: any change re-applies filters against '_items'
-        self.search_edit.textChanged.connect(self.apply_filters)
+        self._categories: list[str] = []  # what the combo offers besides "All"
+        
+        # Filter triggers: any change re-applies filters against '_items'.
+        # Typing is debounced so a word re-filters once, not once per keystroke.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.apply_filters)
+        self.search_edit.textChanged.connect(self._filter_timer.start)
         self.category_combo.currentIndexChanged.connect(self.apply_filters)
         
         # Refresh from API (optional online path)
@@ -129,18 +184,33 @@ class MainWindow(QMainWindow):
         refresh_act.setStatusTip("Reload items from API")
         refresh_act.triggered.connect(self.on_refresh)
         toolbar.addAction(refresh_act)
+        self.refresh_action = refresh_act
         self.refresh_button = toolbar.widgetForAction(refresh_act)
         
+        # Errors are logged (and flashed in the status bar) instead of popping
+        # modal boxes; this action shows the log on demand.
+        self._error_log: list[str] = []
+        errors_act = QAction("Show Errors", self)
+        errors_act.setStatusTip("Show errors from this session")
+        errors_act.triggered.connect(self.on_show_errors)
+        toolbar.addAction(errors_act)
+        # Signals of the in-flight fetch (None when idle)
+        self._fetch_signals: _FetchSignals | None = None
+        
         # -- Table model/view ---------------------------------------------------------------
-        self.model = QStandardItemModel(0, 5, self)
-        self.model.setHorizontalHeaderLabels(
-            ["ID", "Name", "Category", "Quantity", "Timestamp"]
-        )
+        self.model = ItemsTableModel(self)
         
         self.view = QTableView()
         self.view.setModel(self.model)
         self.view.setSelectionBehavior(QTableView.SelectRows)
         self.view.setEditTriggers(QTableView.NoEditTriggers)
+        # Rows are single-line text: a fixed height means the view never asks
+        # cells for their size hints while scrolling or repainting.
+        self.view.setWordWrap(False)
+        vh = self.view.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(vh.fontMetrics().height() + 6)
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         
         # Central widget and layout
         container = QWidget()
@@ -153,6 +223,35 @@ class MainWindow(QMainWindow):
         self.setStatusBar(QStatusBar(self))
         self.statusBar().showMessage("Ready")
         
+    def _log_error(self, message: str):
+        """Add a timestamped 'message' to the session's error log."""
+        self._error_log.append(f"[{datetime.now():%H:%M:%S}] {message}")
+        
+    def _report_error(self, message: str):
+        """Log 'message' and flash it in the status bar (non-blocking)."""
+        self._log_error(message)
+        self.statusBar().showMessage(message, ERROR_STATUS_MS)
+        
+    def on_show_errors(self):
+        """Show the session's error log in a (non-modal) dialog."""
+        if not self._error_log:
+            self.statusBar().showMessage("No errors")
+            return
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Errors")
+        dlg.setAttribute(Qt.WA_DeleteOnClose)
+        text = QPlainTextEdit(dlg)
+        text.setReadOnly(True)
+        text.setPlainText("\n".join(self._error_log))
+        buttons = QDialogButtonBox(QDialogButtonBox.Close, parent=dlg)
+        buttons.rejected.connect(dlg.reject)
+        layout = QVBoxLayout(dlg)
+        layout.addWidget(text)
+        layout.addWidget(buttons)
+        dlg.resize(600, 300)
+        dlg.show()
+        return dlg
+        
     def on_file(self):
         """Placeholder for future File menu handling (unused)"""
         self.statusBar().showMessage("File... clicked")
@@ -162,7 +261,7 @@ class MainWindow(QMainWindow):
         
         Behavior:
             - If the dialog is accepted, create a new item via the domain helper.
-            - '_items' remains the canonical store, and the table will repopulate.
+            - '_items' remains the canonical store, and the new row is appended to the table.
             
         Side Effects:
             - Shows a model dialog.
@@ -170,69 +269,186 @@ class MainWindow(QMainWindow):
         """
         dlg = AddItemDialog(self)
         if dlg.exec() == QDialog.Accepted:
-            items_list = self._items
+            shown = len(self._items)
             data = dlg.data()
             create_new_item(
                 name=data["name"],
-                items=items_list,
+                items=self._items,
                 category=data["category"],
                 quantity=data["quantity"],
             )
             
             # Ensure view reflects the updated in-memory list.
-            self._items = items_list
-            self._populate_table(self._items)
+            self._show_appended(shown)
             self.statusBar().showMessage(f"Added: {data['name']}")
         
     @Slot()
     def on_refresh(self):
-        """Fetch items from the API and refresh the view.
+        """Fetch items from the API in the background, then refresh the view.
         
         Behavior:
-            - Disables the window while fetching (simple reentrancy guard)
-            - Rebuilds the category combo from the refreshed items.
+            - Returns immediately; the window stays responsive during the request.
+            - Only the Refresh action is disabled while a fetch is in flight
+            (reentrancy guard); a second click meanwhile is ignored.
+            - On success ('_on_refresh_done'), updates the category combo (only if the
+            set of categories changed) and re-applies the current filters once.
             
         Failure:
-            - On exception, shows a status message and re-enables the window.
+            - '_on_refresh_failed' shows a status message and re-enables Refresh.
         """
+        if self._fetch_signals is not None:
+            return
         self.statusBar().showMessage("Refreshing...")
-        self.setEnabled(False)
+        self.refresh_action.setEnabled(False)
+        
+        signals = _FetchSignals()
+        signals.finished.connect(self._on_refresh_done)
+        signals.failed.connect(self._on_refresh_failed)
+        self._fetch_signals = signals
+        QThreadPool.globalInstance().start(_FetchRunnable(signals))
+        
+    @Slot(object)
+    def _on_refresh_done(self, items):
+        self._fetch_finished()
+        self._set_items(items)
+        self._set_categories({item["category"] for item in self._items})
+        # One filter pass with the (kept) category and search text
+        with self._bulk():
+            self.apply_filters()
+        
+        self.statusBar().showMessage(f"Loaded {len(items)} items")
+        
+    def _set_categories(self, categories: set[str]):
+        """Offer "All" + sorted 'categories' in the combo, keeping the selection.
+        
+        No-op when the set is unchanged. Signals are blocked while rebuilding so
+        'clear'/'addItems' don't each trigger a re-filter; callers filter once.
+        """
+        categories = sorted(categories)
+        if categories == self._categories:
+            return
+        self._categories = categories
         
+        combo = self.category_combo
+        current = combo.currentText()
+        combo.blockSignals(True)
         try:
-            items = services.get_all_items()
-            self._items = items
-            self._populate_table(items)
+            combo.clear()
+            combo.addItem("All")
+            combo.addItems(categories)
+            combo.setCurrentText(current if current in categories else "All")
+        finally:
+            combo.blockSignals(False)
+        
+    @Slot(str)
+    def _on_refresh_failed(self, message: str):
+        self._fetch_finished()
+        self.statusBar().showMessage(f"Refresh failed: {message}")
+        
+    def _fetch_finished(self):
+        self._fetch_signals = None
+        self.refresh_action.setEnabled(True)
             
-            # Rebuild category options based on current items
-            categories = sorted({item["category"] for item in self._items})
-            self.category_combo.clear()
-            self.category_combo.addItem("All")
-            self.category_combo.addItems(categories)
+    def _set_items(self, items: list[dict]):
+        """Make 'items' the session's collection (drops the cached lowercase indexes)."""
+        self._items = items
+        self._index = []
+        self._by_category = {}
+        self._last_filter = None
+        self._filter_cache.clear()
+        
+    def _lowered(self) -> list[tuple[str, str]]:
+        """Lowercased (name, category) for every item, built once per item.
+        
+        '_items' only changes by appending (add/import) or by '_set_items', so
+        catching up on the tail keeps the index (and '_by_category') in step
+        without a full rebuild.
+        
+        Categories repeat a lot, so each item's category and its lowercase form
+        are interned: one string object per distinct category (less memory, and
+        equal keys compare by identity in '_by_category' lookups).
+        """
+        index = self._index
+        start = len(index)
+        if start < len(self._items):
+            intern = sys.intern
+            lowered: dict[str, str] = {}  # category -> interned lowercase, this batch
+            for item in self._items[start:]:
+                cat = item["category"] = intern(item["category"])
+                cat_lc = lowered.get(cat)
+                if cat_lc is None:
+                    cat_lc = lowered[cat] = intern(cat.lower())
+                index.append((item["name"].lower(), cat_lc))
+            by_category = self._by_category
+            for pos in range(start, len(index)):
+                cat_lc = index[pos][1]
+                rows = by_category.get(cat_lc)
+                if rows is None:
+                    by_category[cat_lc] = [pos]
+                else:
+                    rows.append(pos)
+        return index
+        
+    def _show_appended(self, old_len: int):
+        """Show the items appended to '_items' since it held 'old_len' items.
+        
+        The active category/keyword filter still applies, so new items that
+        don't match it stay hidden. If the table lists exactly the filter's
+        result for the first 'old_len' items (a filter keeps order, so equal
+        length means identical rows), only the matching part of the new tail is
+        inserted; otherwise the filters are re-applied to the whole list.
+        """
+        cat_lc, needle = self._filter_terms()
+        last = self._last_filter
+        if last is not None and last[:3] == (old_len, cat_lc, needle):
+            shown = last[3]
+        elif cat_lc is None and not needle:
+            shown = None  # unfiltered: every old item
+        else:
+            self.apply_filters()
+            return
+        if self.model.rowCount() != (old_len if shown is None else len(shown)):
+            self.apply_filters()
+            return
+        
+        index = self._lowered()
+        tail = range(old_len, len(index))
+        if cat_lc is not None:
+            tail = [pos for pos in tail if index[pos][1] == cat_lc]
+        added = self._keyword_positions(needle, tail)
+        if shown is not None:
+            # Keep narrowing (see 'apply_filters') working from the new total
+            self._last_filter = (len(index), cat_lc, needle, shown + added)
+        items = self._items
+        self.model.append_rows([items[pos] for pos in added])
             
-            self.statusBar().showMessage(f"Loaded {len(items)} items")
-        except Exception as e:
-            self.statusBar().showMessage(f"Refresh failed: {e}")
+    @contextmanager
+    def _bulk(self):
+        """Suspend view repaints and sorting while the model changes a lot at once.
+        
+        The view then lays out and paints once when the block exits instead of
+        reacting to every intermediate change. Previous states are restored even
+        if the block raises.
+        """
+        view = self.view
+        was_sorting = view.isSortingEnabled()
+        view.setUpdatesEnabled(False)
+        view.setSortingEnabled(False)
+        try:
+            yield
         finally:
-            self.setEnabled(True)
+            view.setSortingEnabled(was_sorting)
+            view.setUpdatesEnabled(True)
             
     def _populate_table(self, items: list[dict]):
         """Replace the table contents with 'items'.
         
+        Single model reset; cell text is produced lazily for visible rows only.
+        
         Args:
             items: The list of item dicts to render (often filterd).
         """
-        self.model.removeRows(0, self.model.rowCount())
-        for row_index, item in enumerate(items):
-            values = [
-                str(item["id"]),
-                    item["name"],
-                    item["category"],
-                    str(item["quantity"]),
-                    item["time"],
-            ]
-            for column_index, text in enumerate(values):
-                cell = QStandardItem(text)
-                self.model.setItem(row_index, column_index, cell)
+        self.model.set_rows(items)
                 
     def on_open(self):
         """Open a JSON file and load items into the table.
@@ -243,7 +459,7 @@ class MainWindow(QMainWindow):
             user can refresh categories by hitting Refresh or re-open/import again (to keep behavior minimal).
             
         Failure:
-            - Shows a critical message box and updates the status bar.
+            - Logs the error (see 'on_show_errors') and flashes it in the status bar.
         """
         path, _ = QFileDialog.getOpenFileName(
             self,
@@ -254,19 +470,19 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                self._items = json.load(f)
-            self._populate_table(self._items)
+            # Same reader as the CLI: orjson, memory-mapped for large files
+            self._set_items(read_json(Path(path)))
+            with self._bulk():
+                self._populate_table(self._items)
             self.statusBar().showMessage(f"Opened {Path(path).name}")
         except Exception as e:
-            QMessageBox.critical(self, "Open Failed", f"Could not load JSON:\n{e}")
-            self.statusBar().showMessage("Open failed")
+            self._report_error(f"Open failed: could not load JSON: {e}")
             
     def on_save(self):
         """Save current items to a JSON file chosen by the user.
         
         Failure:
-            - Shows a critical message box and sets a status message.
+            - Logs the error (see 'on_show_errors') and flashes it in the status bar.
             """
         path, _ = QFileDialog.getSaveFileName(
             self,
@@ -277,12 +493,13 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(self._items, f, indent=2)
+            # Same bytes the CLI writes (orjson, 2-space indent, UTF-8)
+            payload = encode_items(self._items)
+            with open(path, "wb") as f:
+                f.write(payload)
             self.statusBar().showMessage(f"Saved to {Path(path).name}")
         except Exception as e:
-            QMessageBox.critical(self, "Save Failed", f"Could not write JSON:\n{e}")
-            self.statusBar().showMessage("Save Failed")
+            self._report_error(f"Save failed: could not write JSON: {e}")
                 
     def on_import(self):
         """Import items from a CSV file and append to the current collection.
@@ -291,11 +508,16 @@ class MainWindow(QMainWindow):
             - Name, Category, Quantity
         
         Behavior:
-            - Calls the domain 'create_new_item' for each row.
-            - Rebuilds the table when done, categories are not auto-rebuilt here.
+            - Calls the domain 'create_new_item' for each row; all rows share the
+            import's timestamp.
+            - Appends the new rows to the table in one batch when done (see
+            '_show_appended'), categories are not auto-rebuilt here.
             
         Failure:
-            - Shows a critical message box and updates the status bar.
+            - A bad row (e.g. non-integer quantity) is logged and skipped; the
+            rest of the file is still imported.
+            - If the file can't be read, the error is logged and flashed in the
+            status bar.
         """
         path, _ = QFileDialog.getOpenFileName(
             self,
@@ -308,24 +530,46 @@ class MainWindow(QMainWindow):
 
         try:
             with open(path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
+                # Plain rows + column positions looked up once (no dict per row).
+                # A missing header column reads as "" (0 for Quantity).
+                reader = csv.reader(f)
+                header = next(reader, [])
+                name_col, cat_col, qty_col = (
+                    header.index(h) if h in header else None
+                    for h in ("Name", "Category", "Quantity")
+                )
                 imported_count = 0
+                bad_rows = 0
+                shown = len(self._items)
+                # One creation time for the whole import (saves a strftime per row)
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
                 for row in reader:
-                    create_new_item(
-                        name=row.get("Name", "").strip(),
-                        items=self._items,
-                        category=row.get("Category", "").strip(),
-                        quantity=int(row.get("Quantity", 0)),
-                    )
+                    if not row:
+                        continue  # blank line (DictReader skipped these too)
+                    try:
+                        create_new_item(
+                            name=row[name_col].strip() if name_col is not None else "",
+                            items=self._items,
+                            category=row[cat_col].strip() if cat_col is not None else "",
+                            quantity=int(row[qty_col]) if qty_col is not None else 0,
+                            timestamp=timestamp,
+                        )
+                    except (ValueError, IndexError) as e:
+                        bad_rows += 1
+                        self._log_error(f"Import {Path(path).name}, line {reader.line_num}: {e}")
+                        continue
                     imported_count += 1
                     
-                self._populate_table(self._items)
-                self.statusBar().showMessage(f"Imported {imported_count} items from {path}")
+            with self._bulk():
+                self._show_appended(shown)
+            message = f"Imported {imported_count} items from {path}"
+            if bad_rows:
+                message += f" ({bad_rows} rows skipped, see Show Errors)"
+            self.statusBar().showMessage(message)
             
         except Exception as e:
-            QMessageBox.critical(self, "Import Failed", f"Could not read CSV:\n{e}")
-            self.statusBar().showMessage("Import failed")
+            self._report_error(f"Import failed: could not read CSV: {e}")
     
     def on_export(self):
         """Export itmems to a CSV chosen by the user.
@@ -334,7 +578,7 @@ class MainWindow(QMainWindow):
             - Uses in-memory '_items' if available, else fetches from the API.
             
         Failure:
-            - Shows a critical message box and updates the status bar.
+            - Logs the error (see 'on_show_errors') and flashes it in the status bar.
         """
         path, _ = QFileDialog.getSaveFileName(
             self,
@@ -346,45 +590,100 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            items = self._items if self._items else services.get_all_items()
-            with open(path, "w", newline="", encoding="utf-8") as f:
+            items = self._items
+            if not items:
+                from api import services  # deferred: see module docstring
+                
+                items = services.get_all_items()
+            with open(path, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER) as f:
                 writer = csv.writer(f)
                 writer.writerow(["ID", "Name", "Category", "Quantity", "Timestamp"])
-                for item in items:
-                    writer.writerow([
+                # One call: the csv module drives the row loop in C
+                writer.writerows(
+                    (
                         item.get("id", ""),
                         item.get("name", ""),
                         item.get("category", ""),
                         item.get("quantity", ""),
                         item.get("time", ""),
-                    ])   
+                    )
+                    for item in items
+                )
             self.statusBar().showMessage(f"Exported {len(items)} items to {path}")
         except Exception as e:
-            QMessageBox.critical(self, "Export Failed", f"Could not write CSV:\n{e}")
-            self.statusBar().showMessage("Export failed")
+            self._report_error(f"Export failed: could not write CSV: {e}")
             
+    def _keyword_positions(self, needle_lc: str, positions=None) -> list[int]:
+        """Positions (default: all) whose lowercase name contains 'needle_lc'.
+        
+        Plain substring test against the cached lowercase names; an empty needle
+        skips the test altogether.
+        """
+        index = self._lowered()
+        if positions is None:
+            if not needle_lc:
+                return list(range(len(index)))
+            return [pos for pos, (name_lc, _) in enumerate(index) if needle_lc in name_lc]
+        if not needle_lc:
+            return list(positions)
+        return [pos for pos in positions if needle_lc in index[pos][0]]
+        
+    def _apply_keyword(self, needle_lc: str, positions=None) -> list[dict]:
+        """Items at 'positions' (default: all) whose lowercase name contains 'needle_lc'."""
+        items = self._items
+        return [items[pos] for pos in self._keyword_positions(needle_lc, positions)]
+        
+    def _filter_terms(self) -> tuple[str | None, str]:
+        """(lowercase category or None for "All", lowercase search text)."""
+        cat = self.category_combo.currentText()
+        cat_lc = None if cat == "All" else cat.lower()
+        return cat_lc, self.search_edit.text().strip().lower()
+        
     def apply_filters(self):
         """Apply category + keyword filters to '_items' and refresh the table.
         
         Filtering:
             - Category: exact, case-insensitive match unless "All" is selected. 
             - Keyword: case-insensitive substring match on 'name'.
+            - A category only visits its own rows ('_by_category'); the keyword
+            is checked against the cached lowercase names (same semantics as
+            'filter_by_category' + 'search_by_keyword').
+            - While typing narrows the search (same category, new text contains
+            the previous text), only the previous matches are re-checked.
+            - The last 'FILTER_CACHE_SIZE' results are kept, keyed by item count,
+            category and text, so toggling back to a recent filter is a lookup.
         
         Side Effects:
             - Updates the status bar with 'showing/total' counts.    
         """
-        text = self.search_edit.text().strip()
-        cat = self.category_combo.currentText()
-        
-        results = list(self._items)
-        
-        if cat != "All":
-            from collectory.analysis import filter_by_category
-            results = filter_by_category(results, cat)
-            
-        if text:
-            from collectory.analysis import search_by_keyword
-            results = search_by_keyword(results, text)
+        # A direct call (category change, tests) supersedes any pending debounce
+        self._filter_timer.stop()
+        cat_lc, needle = self._filter_terms()
+        
+        # '_lowered' first: it brings '_by_category' up to date
+        total = len(self._lowered())
+        key = (total, cat_lc, needle)
+        cache = self._filter_cache
+        positions = cache.get(key)
+        if positions is not None:
+            cache.move_to_end(key)
+        else:
+            last = self._last_filter
+            if last is not None and last[:2] == (total, cat_lc) and last[2] in needle:
+                # Anything matching 'needle' also matched the previous needle
+                candidates = last[3]
+            elif cat_lc is None:
+                candidates = None
+            else:
+                candidates = self._by_category.get(cat_lc, ())
+            positions = self._keyword_positions(needle, candidates)
+            cache[key] = positions
+            if len(cache) > FILTER_CACHE_SIZE:
+                cache.popitem(last=False)
+        self._last_filter = (total, cat_lc, needle, positions)
+        
+        items = self._items
+        results = [items[pos] for pos in positions]
             
         self._populate_table(results)
         
@@ -394,7 +693,10 @@ class MainWindow(QMainWindow):
         
         
 if __name__ == "__main__":
-    # Standard Qt application bootstrap
+    # Standard Qt application bootstrap (same plugin setup as gui/main.py)
+    from gui._qt_bootstrap import configure_plugin_paths
+    
+    configure_plugin_paths()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
@@ -12,17 +12,19 @@ setup(
     long_description=(here / "README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     url="https://github.com/jriver44/collectory",
-    packages=find_packages(exclude=["tests*", "api*"]),
+    packages=find_packages(exclude=["tests*"]),
     python_requires=">=3.8",
     install_requires = [
         "colorama",
         "tabulate",
         "flask",
         "ariadne",
+        "orjson",
     ],
     entry_points={
         "console_scripts": [
             "curation=collectory.collector:main",
+            "curation-server=api.server:main",
         ],
     },
     classifiers = [
@@ -8,7 +8,10 @@ from collectory.analysis import (
     create_new_item,
     remove_item,
     filter_by_category,
-    search_by_keyword
+    search_by_keyword,
+    index_by_category,
+    lowercase_names,
+    combined_distributions
 )
 
 class TestAnalysis(unittest.TestCase):
@@ -72,6 +75,18 @@ class TestAnalysis(unittest.TestCase):
         names = [i['name'] for i in result]
         self.assertCountEqual(names, ["Alpha", "alphabet soup"])
         
+    def test_prebuilt_indexes_match_scans(self):
+        create_new_item("Alpha", self.items, "Misc", 1)
+        create_new_item("Beta", self.items, "misc", 1)
+        create_new_item("alphabet soup", self.items, "food", 1)
+        index = index_by_category(self.items)
+        self.assertEqual(filter_by_category(self.items, "MISC", index=index),
+                         filter_by_category(self.items, "MISC"))
+        self.assertEqual(filter_by_category(self.items, "none", index=index), [])
+        names = lowercase_names(self.items)
+        self.assertEqual(search_by_keyword(self.items, "ALPH", names_lower=names),
+                         search_by_keyword(self.items, "ALPH"))
+        
     def test_get_category_distribution(self):
         items =[
             {"category":"cigar", "quantity":2},
@@ -90,5 +105,25 @@ class TestAnalysis(unittest.TestCase):
         expected = {"2025-06":5, "2025-07":1}
         self.assertEqual(get_time_distribution(items), expected)
         
+    def test_get_time_distribution_custom_format(self):
+        items = [
+        {"time":"2025-06-01 09:00:00","quantity":2},
+        {"time":"2025-06-01 09:00:00","quantity":1},
+        {"time":"2026-01-01 11:00:00","quantity":4},
+        ]
+        self.assertEqual(get_time_distribution(items, fmt="%Y"), {"2025":3, "2026":4})
+        with self.assertRaises(ValueError):
+            get_time_distribution([{"time": "not a time"}], fmt="%Y")
+        
+    def test_combined_distributions_match_separate_passes(self):
+        items = [
+        {"category":"cigar", "time":"2025-06-01 09:00:00","quantity":2},
+        {"category":"book", "time":"2025-06-15 10:00:00"},
+        {"category":"cigar", "time":"2026-07-01 11:00:00","quantity":4},
+        ]
+        for fmt in ("%Y-%m", "%Y"):
+            self.assertEqual(combined_distributions(items, fmt=fmt),
+                             (get_category_distribution(items), get_time_distribution(items, fmt=fmt)))
+        
 if __name__ == "__main__":
     unittest.main()
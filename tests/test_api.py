@@ -32,4 +32,48 @@ def test_error_on_bad_query(client):
     resp = graphql_request(client, " { badField }")
     data = resp.get_json()
     assert "errors" in data
-    assert resp.status_code == 400
\ No newline at end of file
+    assert resp.status_code == 400
+    
+def test_schema_built_once():
+    from api.server import build_schema, schema
+    assert build_schema() is schema
+    
+def test_graphql_explorer_served(client):
+    resp = client.get("/graphql")
+    assert resp.status_code == 200
+    assert b"Curation GraphQL" in resp.data
+    
+def test_get_item_memoized_per_request(client, monkeypatch):
+    calls = []
+    def fake_get(item_id):
+        calls.append(item_id)
+        return {"id": item_id, "name": "A", "category": "X", "quantity": 1, "time": "T"}
+    monkeypatch.setattr(services, "get_item_by_id", fake_get)
+    
+    query = '{ a: getItem(id:"1"){ name } b: getItem(id:"1"){ quantity } c: getItem(id:"2"){ name } }'
+    data = graphql_request(client, query).get_json()
+    assert "errors" not in data
+    assert sorted(calls) == [1, 2]
+    
+    graphql_request(client, query)
+    assert len(calls) == 4
+    
+def test_repeated_queries_reuse_parsed_document(client, monkeypatch):
+    import api.query_cache as qc
+    qc.clear_query_cache()
+    validations = []
+    real_validate = qc.validate
+    monkeypatch.setattr(qc, "validate", lambda *a, **kw: validations.append(1) or real_validate(*a, **kw))
+    monkeypatch.setattr(services, "category_distribution", lambda: [{"category": "X", "count": 2}])
+    
+    query = '{ categoryDistribution { category count } }'
+    for _ in range(3):
+        data = graphql_request(client, query).get_json()
+        assert data["data"]["categoryDistribution"] == [{"category": "X", "count": 2}]
+    assert qc._parse.cache_info().hits == 2
+    assert len(validations) == 1
+    
+    resp = graphql_request(client, " { badField }")
+    assert resp.status_code == 400
+    resp = graphql_request(client, " { badField }")
+    assert resp.status_code == 400
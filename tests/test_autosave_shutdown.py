@@ -22,6 +22,7 @@ def test_autosave_writes_and_stops(monkeypatch, tmp_path):
     # ensure clean loop
     if hasattr(collector, "_stop_event"):
         collector._stop_event.clear()
+    collector._dirty.clear()
     
     # Patch config so writes go to a temp dir and tick quickly
     monkeypatch.setattr(collector, "config", type("C", (), {
@@ -37,7 +38,9 @@ def test_autosave_writes_and_stops(monkeypatch, tmp_path):
     calls = {"n": 0}
     
     # spy: replace save_items so the test doesn't depend on real rotation logic
-    def fake_save(fn, items):
+    def fake_save(fn, items, durable=True, wait=True):
+        assert durable is False, "autosave should skip fsync"
+        assert wait is False, "autosave should not block on the writer"
         calls["n"] += 1
         base.parent.mkdir(parents=True, exist_ok=True)
         base.write_text(json.dumps(items), encoding="utf-8")
@@ -52,7 +55,16 @@ def test_autosave_writes_and_stops(monkeypatch, tmp_path):
     t = threading.Thread(target=collector.autosave_loop, args=(file_name, items), daemon=True)
     t.start()
     
-    # prove it runs at least twice
+    # clean ticks don't write
+    time.sleep(0.15)
+    assert calls["n"] == 0, "autosave wrote without any changes"
+    
+    # prove it runs once per dirty period
+    collector._dirty.set()
+    assert _wait_until(lambda: calls["n"] >= 1), "autosave did not run after a change"
+    time.sleep(0.15)
+    assert calls["n"] == 1, "autosave rewrote an unchanged collection"
+    collector._dirty.set()
     assert _wait_until(lambda: calls["n"] >= 2), "autosave did not run twice"
     
     n_before = calls["n"]
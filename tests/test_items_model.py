@@ -0,0 +1,34 @@
+from PySide6.QtCore import Qt
+from gui.items_model import ItemsTableModel
+
+def test_items_model_exposes_rows(qtbot):
+    items = [
+        {"id": 1, "name": "Coin", "category": "Metal", "quantity": 5, "time": "2025-01-01 00:00:00"},
+        {"id": "b", "name": "Stamp", "category": "Paper", "quantity": 1, "time": "2025-01-02 00:00:00"},
+    ]
+    model = ItemsTableModel()
+    assert model.rowCount() == 0
+    
+    model.set_rows(items)
+    items.append({"id": 3})  # the model keeps its own row list
+    assert (model.rowCount(), model.columnCount()) == (2, 5)
+    assert model.data(model.index(0, 0)) == "1"
+    assert model.data(model.index(0, 3)) == "5"
+    assert model.data(model.index(1, 4)) == "2025-01-02 00:00:00"
+    assert model.data(model.index(1, 1), Qt.EditRole) is None
+    assert [model.headerData(c, Qt.Horizontal) for c in range(5)] == ["ID", "Name", "Category", "Quantity", "Timestamp"]    
+    
+def test_items_model_caches_row_text_until_rows_are_replaced(qtbot):
+    item = {"id": 1, "name": "Coin", "category": "Metal", "quantity": 5, "time": "T"}
+    model = ItemsTableModel()
+    model.set_rows([item])
+    assert model.data(model.index(0, 3)) == "5"
+    
+    item["quantity"] = 6
+    assert model.data(model.index(0, 3)) == "5"  # converted once per row
+    
+    model.set_rows([item])
+    assert model.data(model.index(0, 3)) == "6"
+    
+    model.append_rows([{"id": 2, "name": "Stamp", "category": "Paper", "quantity": 1, "time": "T"}])
+    assert model.data(model.index(1, 1)) == "Stamp"
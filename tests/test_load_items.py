@@ -0,0 +1,43 @@
+import json
+
+from collectory import collector
+
+
+def test_load_items_reads_list(tmp_path):
+    path = tmp_path / "col.json"
+    items = [{
+        "id": "a", "name": "Café", "category": "X", "quantity": 1,
+        "time": "2025-01-01 00:00:00",
+    }]
+    path.write_text(json.dumps(items, ensure_ascii=False), encoding="utf-8")
+    assert collector.load_items(path) == items
+
+
+def test_load_items_missing_file(tmp_path):
+    assert collector.load_items(tmp_path / "missing.json") == []
+
+
+def test_load_items_non_list(tmp_path):
+    path = tmp_path / "col.json"
+    path.write_text('{"not": "a list"}', encoding="utf-8")
+    assert collector.load_items(path) == []
+    assert path.exists()
+
+
+def test_load_items_quarantines_corrupt_file(tmp_path):
+    path = tmp_path / "col.json"
+    path.write_text("[{broken", encoding="utf-8")
+    assert collector.load_items(path) == []
+    assert not path.exists()
+    assert len(list(tmp_path.glob("col_corrupt_*.json"))) == 1
+
+
+def test_load_items_memory_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(collector, "MMAP_THRESHOLD", 1)
+    path = tmp_path / "col.json"
+    items = [{"id": str(i), "name": f"N{i}"} for i in range(100)]
+    path.write_text(json.dumps(items), encoding="utf-8")
+    assert collector.load_items(path) == items
+
+    path.write_text("", encoding="utf-8")
+    assert collector.load_items(path) == []
@@ -0,0 +1,175 @@
+from gui.main_window import MainWindow
+
+ITEMS = [
+    {"id": "1", "name": "Silver Coin", "category": "Metal", "quantity": 1, "time": "2025-01-01 00:00:00"},
+    {"id": "2", "name": "Gold Coin", "category": "Metal", "quantity": 2, "time": "2025-01-02 00:00:00"},
+    {"id": "3", "name": "Stamp", "category": "Paper", "quantity": 3, "time": "2025-01-03 00:00:00"},
+]
+
+def _window(qtbot):
+    win = MainWindow()
+    qtbot.addWidget(win)
+    win._set_items(list(ITEMS))
+    win._populate_table(win._items)
+    return win
+
+def test_search_is_debounced(qtbot):
+    win = _window(qtbot)
+    resets = []
+    win.model.modelReset.connect(lambda: resets.append(1))
+    
+    for prefix in ("c", "co", "coi", "coin"):
+        win.search_edit.setText(prefix)
+    assert resets == []
+    qtbot.waitUntil(lambda: resets == [1], timeout=2000)
+    assert win.model.rowCount() == 2
+    
+def test_category_filter_applies_immediately(qtbot):
+    win = _window(qtbot)
+    win.category_combo.addItems(["Metal", "Paper"])
+    win.category_combo.setCurrentText("Paper")
+    assert win.model.rowCount() == 1
+    assert win.model.rows()[0]["name"] == "Stamp"
+    
+def test_filters_follow_appended_items(qtbot):
+    win = _window(qtbot)
+    win.search_edit.setText("coin")
+    win.apply_filters()
+    assert win.model.rowCount() == 2
+    
+    win._items.append({"id": "4", "name": "Copper COIN", "category": "metal", "quantity": 1, "time": "2025-01-04 00:00:00"})
+    win.category_combo.addItem("Metal")
+    win.category_combo.setCurrentText("Metal")
+    assert [item["id"] for item in win.model.rows()] == ["1", "2", "4"]
+    
+    win._set_items([])
+    win.apply_filters()
+    assert win.model.rowCount() == 0    
+    
+def test_appended_items_respect_active_filter(qtbot):
+    win = _window(qtbot)
+    win.category_combo.addItems(["Metal", "Paper"])
+    win.category_combo.setCurrentText("Metal")
+    win.search_edit.setText("coin")
+    win.apply_filters()
+    resets = []
+    win.model.modelReset.connect(lambda: resets.append(1))
+    
+    old_len = len(win._items)
+    win._items.append({"id": "4", "name": "Copper Coin", "category": "Metal", "quantity": 1, "time": "T"})
+    win._items.append({"id": "5", "name": "Tin Coin", "category": "Paper", "quantity": 1, "time": "T"})
+    win._items.append({"id": "6", "name": "Bar", "category": "Metal", "quantity": 1, "time": "T"})
+    win._show_appended(old_len)
+    
+    assert [item["id"] for item in win.model.rows()] == ["1", "2", "4"]
+    assert resets == []  # only the matching tail was inserted
+    assert win._last_filter == (6, "metal", "coin", [0, 1, 3])
+    
+    
+def test_appended_items_refilter_when_view_is_stale(qtbot):
+    win = _window(qtbot)
+    win.search_edit.setText("stamp")  # typed, but the debounce hasn't fired
+    
+    old_len = len(win._items)
+    win._items.append({"id": "4", "name": "Old Stamp", "category": "Paper", "quantity": 1, "time": "T"})
+    win._show_appended(old_len)
+    
+    assert [item["id"] for item in win.model.rows()] == ["3", "4"]
+    
+    
+def test_bulk_suspends_repaints_and_restores_sorting(qtbot):
+    win = _window(qtbot)
+    win.view.setSortingEnabled(True)
+    
+    try:
+        with win._bulk():
+            assert not win.view.isSortingEnabled()
+            assert not win.view.updatesEnabled()
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    
+    assert win.view.isSortingEnabled()
+    assert win.view.updatesEnabled()
+    
+    
+def test_category_index_combines_with_keyword(qtbot):
+    win = _window(qtbot)
+    win.category_combo.addItems(["Metal", "Wood"])
+    win.search_edit.setText("gold")
+    win.category_combo.setCurrentText("Metal")
+    assert [item["id"] for item in win.model.rows()] == ["2"]
+    assert win._by_category == {"metal": [0, 1], "paper": [2]}
+    
+    win.category_combo.setCurrentText("Wood")
+    assert win.model.rowCount() == 0
+    
+    
+def test_apply_keyword(qtbot):
+    win = _window(qtbot)
+    assert [item["id"] for item in win._apply_keyword("")] == ["1", "2", "3"]
+    assert [item["id"] for item in win._apply_keyword("coin")] == ["1", "2"]
+    assert [item["id"] for item in win._apply_keyword("", [2, 0])] == ["3", "1"]
+    assert [item["id"] for item in win._apply_keyword("silver", [1, 2])] == []
+    
+    
+def test_table_rows_have_fixed_height(qtbot):
+    from PySide6.QtWidgets import QHeaderView
+    
+    win = _window(qtbot)
+    vh = win.view.verticalHeader()
+    assert vh.sectionResizeMode(0) == QHeaderView.Fixed
+    # Qt clamps to the style's minimum section size
+    assert vh.defaultSectionSize() == max(vh.minimumSectionSize(), vh.fontMetrics().height() + 6)
+    assert not win.view.wordWrap()
+    
+    
+def test_lowered_index_interns_categories(qtbot):
+    win = _window(qtbot)
+    win._items.append({"id": "4", "name": "Copper", "category": "".join(["Me", "tal"]), "quantity": 1, "time": "T"})
+    index = win._lowered()
+    assert win._items[3]["category"] is win._items[0]["category"]
+    assert index[3][1] is index[0][1] == "metal"
+    
+    
+def test_typing_narrows_previous_matches(qtbot):
+    win = _window(qtbot)
+    win.search_edit.setText("coin")
+    win.apply_filters()
+    assert win._last_filter == (3, None, "coin", [0, 1])
+    
+    win.search_edit.setText("gold coin")
+    win.apply_filters()
+    assert [item["id"] for item in win.model.rows()] == ["2"]
+    
+    # Widening the search or appending items starts from all items again
+    win.search_edit.setText("")
+    win.apply_filters()
+    assert win.model.rowCount() == 3
+    win._items.append({"id": "4", "name": "Old Stamp", "category": "Paper", "quantity": 1, "time": "T"})
+    win.search_edit.setText("old")
+    win.apply_filters()
+    assert [item["id"] for item in win.model.rows()] == ["2", "4"]
+    
+    
+def test_recent_filters_are_cached(qtbot, monkeypatch):
+    import gui.main_window as mw
+    
+    monkeypatch.setattr(mw, "FILTER_CACHE_SIZE", 2)
+    win = _window(qtbot)
+    win.category_combo.addItems(["Metal", "Paper"])
+    
+    win.category_combo.setCurrentText("Metal")
+    win.category_combo.setCurrentText("Paper")
+    calls = []
+    real = win._keyword_positions
+    monkeypatch.setattr(win, "_keyword_positions", lambda *args: calls.append(args) or real(*args))
+    
+    win.category_combo.setCurrentText("Metal")
+    assert calls == []  # served from the cache
+    assert [item["id"] for item in win.model.rows()] == ["1", "2"]
+    
+    win.category_combo.setCurrentText("All")  # evicts the oldest ("Paper")
+    win.category_combo.setCurrentText("Paper")
+    assert len(calls) == 2
+    assert list(win._filter_cache) == [(3, None, ""), (3, "paper", "")]
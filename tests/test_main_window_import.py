@@ -1,5 +1,5 @@
 import csv, io, pytest
-from PySide6.QtWidgets import QFileDialog
+from PySide6.QtWidgets import QFileDialog, QPlainTextEdit
 from gui.main_window import MainWindow
 
 def test_import_csv(tmp_path, qtbot, monkeypatch):
@@ -41,4 +41,58 @@ def test_import_csv(tmp_path, qtbot, monkeypatch):
         "name": "TestItem",
         "category": "TestCat",
         "quantity": 7,
-    }
\ No newline at end of file
+    }    
+    
+def test_import_appends_rows_in_one_batch(tmp_path, qtbot, monkeypatch):
+    path = tmp_path / "in.csv"
+    path.write_text("Name,Category,Quantity\nA,X,1\nB,Y,2\nC,X,3\n", encoding="utf-8")
+    monkeypatch.setattr(QFileDialog, "getOpenFileName", lambda *args, **kwargs: (str(path), ""))
+    
+    win = MainWindow()
+    qtbot.addWidget(win)
+    win._set_items([{"id": "0", "name": "Old", "category": "X", "quantity": 1, "time": "T"}])
+    win._populate_table(win._items)
+    
+    inserts, resets = [], []
+    win.model.rowsInserted.connect(lambda parent, first, last: inserts.append((first, last)))
+    win.model.modelReset.connect(lambda: resets.append(1))
+    win.on_import()
+    
+    assert inserts == [(1, 3)]
+    assert resets == []
+    assert [item["name"] for item in win.model.rows()] == ["Old", "A", "B", "C"]
+    assert len({item["time"] for item in win._items[1:]}) == 1  # one timestamp per import
+    
+    
+def test_import_skips_bad_rows_and_logs_them(tmp_path, qtbot, monkeypatch):
+    path = tmp_path / "in.csv"
+    path.write_text("Name,Category,Quantity\nA,X,1\nB,Y,lots\nC,X,3\n", encoding="utf-8")
+    monkeypatch.setattr(QFileDialog, "getOpenFileName", lambda *args, **kwargs: (str(path), ""))
+    
+    win = MainWindow()
+    qtbot.addWidget(win)
+    win.on_import()
+    
+    assert [item["name"] for item in win.model.rows()] == ["A", "C"]
+    assert "1 rows skipped" in win.statusBar().currentMessage()
+    assert len(win._error_log) == 1
+    assert "in.csv, line 3" in win._error_log[0]
+    
+    dlg = win.on_show_errors()
+    qtbot.addWidget(dlg)
+    assert "lots" in dlg.findChild(QPlainTextEdit).toPlainText()
+    
+    
+def test_import_resolves_columns_by_header(tmp_path, qtbot, monkeypatch):
+    path = tmp_path / "in.csv"
+    # Reordered columns, an extra one, a blank line, a short row, no Category column
+    path.write_text("Quantity,Extra,Name\n2,x,A\n\n5\n", encoding="utf-8")
+    monkeypatch.setattr(QFileDialog, "getOpenFileName", lambda *args, **kwargs: (str(path), ""))
+    
+    win = MainWindow()
+    qtbot.addWidget(win)
+    win.on_import()
+    
+    assert [(item["name"], item["category"], item["quantity"]) for item in win._items] == [("A", "", 2)]
+    assert len(win._items[0]["time"]) == len("2025-01-01 00:00:00")
+    assert len(win._error_log) == 1  # the short row
@@ -0,0 +1,52 @@
+import json
+from PySide6.QtWidgets import QFileDialog
+from gui.main_window import MainWindow
+
+def test_save_then_open_round_trip(tmp_path, qtbot, monkeypatch):
+    items = [
+        {"id": "1", "name": "Café", "category": "Bar", "quantity": 5, "time": "2025-07-18 12:00:00"},
+        {"id": "2", "name": "Stamp", "category": "Paper", "quantity": 1, "time": "2025-07-19 12:00:00"},
+    ]
+    path = tmp_path / "col.json"
+    monkeypatch.setattr(QFileDialog, "getSaveFileName", lambda *args, **kwargs: (str(path), ""))
+    monkeypatch.setattr(QFileDialog, "getOpenFileName", lambda *args, **kwargs: (str(path), ""))
+    
+    win = MainWindow()
+    qtbot.addWidget(win)
+    win._set_items(items)
+    win.on_save()
+    assert path.read_bytes() == json.dumps(items, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    other = MainWindow()
+    qtbot.addWidget(other)
+    other.on_open()
+    assert other._items == items
+    assert other.model.rowCount() == 2    
+    
+def test_open_large_file_uses_mmap_reader(tmp_path, qtbot, monkeypatch):
+    from collectory import collector
+    
+    monkeypatch.setattr(collector, "MMAP_THRESHOLD", 1)  # every file counts as large
+    items = [{"id": "1", "name": "Coin", "category": "Metal", "quantity": 2, "time": "2025-07-18 12:00:00"}]
+    path = tmp_path / "col.json"
+    path.write_text(json.dumps(items), encoding="utf-8")
+    monkeypatch.setattr(QFileDialog, "getOpenFileName", lambda *args, **kwargs: (str(path), ""))
+    
+    win = MainWindow()
+    qtbot.addWidget(win)
+    win.on_open()
+    assert win._items == items
+    assert win.model.rowCount() == 1
+    
+    
+def test_open_failure_is_logged_not_modal(tmp_path, qtbot, monkeypatch):
+    path = tmp_path / "bad.json"
+    path.write_text("{not json", encoding="utf-8")
+    monkeypatch.setattr(QFileDialog, "getOpenFileName", lambda *args, **kwargs: (str(path), ""))
+    
+    win = MainWindow()
+    qtbot.addWidget(win)
+    win.on_open()
+    
+    assert win.statusBar().currentMessage().startswith("Open failed")
+    assert len(win._error_log) == 1
@@ -1,23 +1,53 @@
 from gui.main_window import MainWindow
 import api.services as services
 
-def test_on_refresh_success(monkeypatch):
+def test_on_refresh_success(qtbot, monkeypatch):
     SAMPLE = [{"id": 1, "name": "Y", "category": "X", "quantity": 5, "time": "T"}]
     monkeypatch.setattr(services, "get_all_items", lambda: SAMPLE)
     
     win = MainWindow()
+    qtbot.addWidget(win)
     win.on_refresh()
     
+    # The fetch runs on a pool thread; the GUI stays usable meanwhile
+    assert not win.refresh_action.isEnabled()
+    qtbot.waitUntil(lambda: win.refresh_action.isEnabled(), timeout=5000)
     assert win.model.rowCount() == 1
     assert "Loaded 1 items" in win.statusBar().currentMessage()
     
-def test_on_refresh_failure(monkeypatch):
+def test_on_refresh_failure(qtbot, monkeypatch):
     monkeypatch.setattr(services, "get_all_items", lambda: (_ for _ in ()).throw(Exception("network error")))
     
     win =  MainWindow()
+    qtbot.addWidget(win)
     win.on_refresh()
+    qtbot.waitUntil(lambda: win.refresh_action.isEnabled(), timeout=5000)
     
     assert win.model.rowCount() == 0
     msg = win.statusBar().currentMessage()
     assert msg.startswith("Refresh failed:")
-    assert "network error" in msg
\ No newline at end of file
+    assert "network error" in msg    
+    
+def test_refresh_keeps_category_and_filters_once(qtbot, monkeypatch):
+    SAMPLE = [
+        {"id": 1, "name": "A", "category": "X", "quantity": 5, "time": "T"},
+        {"id": 2, "name": "B", "category": "Y", "quantity": 1, "time": "T"},
+    ]
+    monkeypatch.setattr(services, "get_all_items", lambda: list(SAMPLE))
+    
+    win = MainWindow()
+    qtbot.addWidget(win)
+    win.on_refresh()
+    qtbot.waitUntil(lambda: win.refresh_action.isEnabled(), timeout=5000)
+    assert [win.category_combo.itemText(i) for i in range(win.category_combo.count())] == ["All", "X", "Y"]
+    
+    win.category_combo.setCurrentText("Y")
+    assert win.model.rowCount() == 1
+    
+    resets = []
+    win.model.modelReset.connect(lambda: resets.append(1))
+    win.on_refresh()
+    qtbot.waitUntil(lambda: win.refresh_action.isEnabled(), timeout=5000)
+    assert win.category_combo.currentText() == "Y"
+    assert resets == [1]
+    assert [item["name"] for item in win.model.rows()] == ["B"]
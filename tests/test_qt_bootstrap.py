@@ -0,0 +1,15 @@
+from PySide6.QtCore import QCoreApplication
+
+from gui import _qt_bootstrap
+
+
+def test_configure_plugin_paths_runs_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(_qt_bootstrap, "_DONE", False)
+    monkeypatch.setattr(QCoreApplication, "setLibraryPaths", staticmethod(lambda paths: calls.append(paths)))
+    
+    _qt_bootstrap.configure_plugin_paths()
+    _qt_bootstrap.configure_plugin_paths()
+    
+    assert len(calls) == 1
+    assert calls[0][0].endswith("plugins")
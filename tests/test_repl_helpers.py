@@ -0,0 +1,94 @@
+from collectory import collector
+
+
+def test_prompts_retry_until_valid(monkeypatch, capsys):
+    answers = iter(["", "  ", "Coin", "x", "0", "3"])
+    shown = []
+
+    def fake_input(text):
+        shown.append(text)
+        return next(answers)
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    assert collector.prompt_nonempty("Name: ") == "Coin"
+    assert collector.prompt_positive_int("Qty: ") == 3
+    yellow = collector.Fore.YELLOW
+    assert shown == [yellow + "Name: "] * 3 + [yellow + "Qty: "] * 3
+
+
+def test_index_items_first_match_wins():
+    first = {"name": "Coin", "category": "Metal", "quantity": 1}
+    dup = {"name": "COIN", "category": "metal", "quantity": 2}
+    other = {"name": "Coin", "category": "Paper", "quantity": 3}
+    index = collector.index_items([first, dup, other])
+    assert index[("coin", "metal")] is first
+    assert index[("coin", "paper")] is other
+    assert len(index) == 2
+
+
+def test_edit_category_with_index_matches_scan(monkeypatch):
+    monkeypatch.setattr(collector, "prompt_nonempty", lambda text: "Paper")
+    for use_index in (False, True):
+        items = [
+            {"name": "Stamp", "category": "Old"},
+            {"name": "Coin", "category": "Metal"},
+            {"name": "COIN", "category": "Gold"},
+        ]
+        index = collector.index_items(items) if use_index else None
+        assert collector.edit_category(items, "coin", index) is True
+        assert [i["category"] for i in items] == ["Old", "Paper", "Gold"]
+        assert collector.edit_category(items, "missing", index) is False
+        if use_index:
+            assert index == collector.index_items(items)
+
+
+def test_show_table_renders_rows(capsys):
+    collector.show_table([
+        {"id": "a1", "name": "Coin", "category": "Metal", "quantity": 2,
+         "time": "2025-01-01 00:00:00"},
+        {"name": "Stamp", "category": "Paper", "quantity": 1,
+         "time": "2025-01-02 00:00:00"},
+    ])
+    out = capsys.readouterr().out
+    assert "| ID" in out and "a1" in out and "Stamp" in out and "Paper" in out
+
+
+def test_show_table_keeps_numeric_looking_text(capsys):
+    collector.show_table([
+        {"id": "1", "name": "007", "category": "1e3", "quantity": 2,
+         "time": "2025-01-01 00:00:00"},
+        {"id": "2", "name": "42", "category": "10", "quantity": 10,
+         "time": "2025-01-02 00:00:00"},
+    ])
+    out = capsys.readouterr().out
+    assert "| 007 " in out and "| 1e3 " in out
+    assert "|          2 |" in out  # Quantity stays right-aligned
+
+
+def test_show_table_reuses_render_until_mutation(monkeypatch, capsys):
+    renders = []
+    real_tabulate = collector.tabulate
+
+    def spy_tabulate(*args, **kwargs):
+        renders.append(1)
+        return real_tabulate(*args, **kwargs)
+
+    monkeypatch.setattr(collector, "tabulate", spy_tabulate)
+    monkeypatch.setattr(collector, "_table_cache", None)
+    items = [{
+        "id": "a1", "name": "Coin", "category": "Metal", "quantity": 2,
+        "time": "2025-01-01 00:00:00",
+    }]
+
+    collector.show_table(items, revision=collector._revision)
+    collector.show_table(items, revision=collector._revision)
+    assert len(renders) == 1
+
+    items[0]["quantity"] = 7
+    collector._mark_dirty()
+    collector._dirty.clear()
+    collector.show_table(items, revision=collector._revision)
+    assert len(renders) == 2
+    assert "7" in capsys.readouterr().out.split("Metal")[-1]
+    collector.show_table(items)
+    assert len(renders) == 3
@@ -72,4 +72,85 @@ def test_list_items_rest(client, monkeypatch):
     monkeypatch.setattr("api.services.get_all_items", lambda: SAMPLE)
     res = client.get("/items")
     assert res.status_code == 200
-    assert res.get_json() == SAMPLE
\ No newline at end of file
+    assert res.get_json() == SAMPLE
+    
+def test_responses_use_orjson_provider(client, monkeypatch):
+    from api.json_provider import OrjsonProvider
+    from api.server import app
+    assert isinstance(app.json, OrjsonProvider)
+    SAMPLE = [{"name": "A", "id": 1}]
+    monkeypatch.setattr("api.services.get_all_items", lambda: SAMPLE)
+    res = client.get("/items")
+    assert res.status_code == 200
+    assert res.mimetype == "application/json"
+    assert res.get_json() == SAMPLE
+    
+def test_provider_honours_sort_keys_kwarg():
+    from api.server import app
+    assert app.json.dumps({"b": 1, "a": 2}, sort_keys=True) == '{"a":2,"b":1}'
+    assert app.json.dumps({"b": 1, "a": 2}, sort_keys=False) == '{"b":1,"a":2}'
+    
+def test_responses_are_compact_in_debug(client, monkeypatch):
+    from api.server import app
+    monkeypatch.setattr(app, "debug", True)
+    monkeypatch.setattr("api.services.get_all_items", lambda: [{"name": "A", "id": 1}])
+    res = client.get("/items")
+    assert res.data == b'[{"name":"A","id":1}]\n'
+    
+def test_large_json_responses_are_gzipped(client, monkeypatch):
+    import gzip, json
+    SAMPLE = [{"id": i, "name": f"Item {i}", "category": "Cigar", "quantity": 1, "time": "2025-01-01 00:00:00"}
+              for i in range(50)]
+    monkeypatch.setattr("api.services.get_all_items", lambda: SAMPLE)
+    res = client.get("/items", headers={"Accept-Encoding": "gzip"})
+    assert res.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in res.headers["Vary"]
+    assert json.loads(gzip.decompress(res.data)) == SAMPLE
+    
+    plain = client.get("/items")
+    assert "Content-Encoding" not in plain.headers
+    assert plain.get_json() == SAMPLE
+    
+def test_get_routes_honour_etag(client, monkeypatch):
+    calls = []
+    monkeypatch.setattr("api.services.collection_etag", lambda: "v1")
+    monkeypatch.setattr("api.services.get_all_items", lambda: calls.append(1) or [])
+    res = client.get("/items")
+    assert res.status_code == 200
+    assert res.headers["ETag"] == 'W/"v1"'
+    assert res.headers["Cache-Control"] == "private, no-cache"
+    
+    res = client.get("/items", headers={"If-None-Match": 'W/"v1"'})
+    assert res.status_code == 304
+    assert res.data == b""
+    assert len(calls) == 1
+    
+    monkeypatch.setattr("api.services.collection_etag", lambda: "v2")
+    res = client.get("/items", headers={"If-None-Match": 'W/"v1"'})
+    assert res.status_code == 200
+    assert len(calls) == 2
+    
+def test_large_list_is_streamed(client, monkeypatch):
+    import gzip, json
+    import api.rest as rest
+    monkeypatch.setattr(rest, "STREAM_CHUNK", 3)
+    SAMPLE = [{"id": i, "name": f"Item {i}", "category": "C", "quantity": i, "time": "2025-01-01 00:00:00"}
+              for i in range(10)]
+    monkeypatch.setattr("api.services.get_all_items", lambda: SAMPLE)
+    res = client.get("/items")
+    assert res.is_streamed
+    assert res.get_json() == SAMPLE
+    
+    res = client.get("/items", headers={"Accept-Encoding": "gzip"})
+    assert res.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(res.data)) == SAMPLE
+    
+def test_streamed_list_uses_provider_default(client, monkeypatch):
+    from decimal import Decimal
+    import api.rest as rest
+    monkeypatch.setattr(rest, "STREAM_CHUNK", 1)
+    SAMPLE = [{"id": i, "quantity": Decimal("1.5")} for i in range(3)]
+    monkeypatch.setattr("api.services.get_all_items", lambda: SAMPLE)
+    res = client.get("/items")
+    assert res.is_streamed
+    assert res.get_json() == [{"id": i, "quantity": "1.5"} for i in range(3)]
@@ -0,0 +1,220 @@
+import json
+import os
+import stat
+import threading
+
+import pytest
+
+from collectory import collector
+
+
+@pytest.fixture
+def patch_config(monkeypatch, tmp_path):
+    """Point 'collector.config' at tmp_path; call the result to override settings."""
+    def apply(**overrides):
+        settings = {
+            "DATA_DIR": tmp_path,
+            "AUTOSAVE_ENABLED": True,
+            "AUTOSAVE_INTERVAL": 0.05,
+            "BACKUP_SUFFIX": "_bak",
+            "MAX_BACKUPS": 3,
+            "BACKUP_ROTATE_EVERY": 1,
+        }
+        settings.update(overrides)
+        monkeypatch.setattr(collector, "config", type("C", (), settings))
+
+    apply()
+    return apply
+
+
+def test_save_items_writes_base_and_backup(patch_config, tmp_path):
+    items = [{
+        "id": "a", "name": "Café", "category": "X", "quantity": 2,
+        "time": "2025-01-01 00:00:00",
+    }]
+
+    assert collector.save_items("col", items) is True
+    base = tmp_path / "col.json"
+    backups = list(tmp_path.glob("col_*_bak.json"))
+    assert json.loads(base.read_text("utf-8")) == items
+    assert len(backups) == 1
+    assert backups[0].read_bytes() == base.read_bytes()
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # The backup keeps its snapshot after the base is rewritten
+    items[0]["quantity"] = 5
+    collector.atomic_write(base, collector.encode_items(items))
+    assert json.loads(backups[0].read_text("utf-8"))[0]["quantity"] == 2
+    # ...and when it is rewritten in place (GUI Save, editors)
+    with open(base, "wb") as f:
+        f.write(b"[]")
+    assert json.loads(backups[0].read_text("utf-8"))[0]["quantity"] == 2
+    assert os.stat(base).st_ino != os.stat(backups[0]).st_ino
+
+
+def test_save_items_fsync_only_when_durable(patch_config, monkeypatch, tmp_path):
+    synced = []
+    real_fsync = os.fsync
+
+    def spy_fsync(fd):
+        synced.append("dir" if stat.S_ISDIR(os.fstat(fd).st_mode) else "file")
+        real_fsync(fd)
+
+    monkeypatch.setattr(collector.os, "fsync", spy_fsync)
+
+    assert collector.save_items("col", [{"id": "a"}], durable=False) is True
+    assert synced == []
+    assert collector.save_items("col", [{"id": "b"}]) is True
+    assert synced == ["file", "dir"]
+    assert json.loads((tmp_path / "col.json").read_text("utf-8")) == [{"id": "b"}]
+
+
+def test_encode_items_matches_stdlib_layout():
+    items = [{"id": "a", "name": "Café", "category": "X", "quantity": 2, "tags": []}]
+    expected = json.dumps(items, indent=2, ensure_ascii=False).encode("utf-8")
+    assert collector.encode_items(items) == expected
+    assert collector.encode_items([]) == b"[]"
+
+
+def test_atomic_write_handles_short_writes(monkeypatch, tmp_path):
+    real_write = os.write
+
+    def short_write(fd, data):
+        return real_write(fd, bytes(data[:7]))
+
+    monkeypatch.setattr(collector.os, "write", short_write)
+    target = tmp_path / "col.json"
+    items = [{"id": str(i), "name": "Café"} for i in range(20)]
+    payload = collector.encode_items(items)
+
+    collector.atomic_write(target, payload, durable=False)
+    assert target.read_bytes() == payload
+    assert [p.name for p in tmp_path.iterdir()] == ["col.json"]
+
+
+def test_save_encodes_once_for_main_file_and_backup(
+    patch_config, monkeypatch, tmp_path
+):
+    encodes = []
+    real_encode = collector.encode_items
+
+    def spy_encode(items):
+        encodes.append(1)
+        return real_encode(items)
+
+    monkeypatch.setattr(collector, "encode_items", spy_encode)
+
+    assert collector.save_items("col", [{"id": "a", "quantity": 1}]) is True
+    backup, = tmp_path.glob("col_*_bak.json")
+    assert len(encodes) == 1
+    assert backup.read_bytes() == (tmp_path / "col.json").read_bytes()
+    assert not os.path.samefile(backup, tmp_path / "col.json")
+
+
+def test_backups_within_one_second_do_not_collide(patch_config, tmp_path):
+    patch_config(MAX_BACKUPS=10)
+    for n in range(3):
+        assert collector.save_items("col", [{"id": "a", "quantity": n}])
+    backups = sorted(tmp_path.glob("col_*_bak.json"))
+    assert len(backups) == 3
+    quantities = [json.loads(b.read_text("utf-8"))[0]["quantity"] for b in backups]
+    assert quantities == [0, 1, 2]
+
+
+def test_unchanged_payload_is_not_rewritten(patch_config, monkeypatch, tmp_path):
+    patch_config(MAX_BACKUPS=10)
+    writes = []
+    real_write = collector.atomic_write
+
+    def spy_write(path, *args, **kwargs):
+        # Count main-file writes only (backups go through atomic_write too)
+        if path.name == "col.json":
+            writes.append(path)
+        return real_write(path, *args, **kwargs)
+
+    monkeypatch.setattr(collector, "atomic_write", spy_write)
+    items = [{"id": "a", "quantity": 1}]
+
+    assert collector.save_items("col", items, durable=False) is True
+    assert collector.save_items("col", items, durable=False) is collector.UNCHANGED
+    assert len(writes) == 1
+    # First durable save of lazily-written content still goes to disk
+    assert collector.save_items("col", items)
+    assert collector.save_items("col", items)
+    assert len(writes) == 2
+
+    (tmp_path / "col.json").unlink()
+    assert collector.save_items("col", items)
+    items[0]["quantity"] = 2
+    assert collector.save_items("col", items)
+    assert len(writes) == 4
+    assert len(list(tmp_path.glob("col_*_bak.json"))) == 4
+
+    # Rewritten in place behind our back (GUI Save, an editor): write it again
+    with open(tmp_path / "col.json", "wb") as f:
+        f.write(b"[]")
+    assert collector.save_items("col", items)
+    assert len(writes) == 5
+    assert json.loads((tmp_path / "col.json").read_text("utf-8")) == items
+
+
+def test_writer_thread_saves_and_keeps_latest(patch_config, monkeypatch, tmp_path):
+    written = []
+    gate = threading.Event()
+    real_write = collector._write_snapshot
+
+    def slow_write(file_name, payload, durable):
+        gate.wait(timeout=2)
+        written.append(json.loads(payload))
+        return real_write(file_name, payload, durable)
+
+    monkeypatch.setattr(collector, "_write_snapshot", slow_write)
+    collector.start_writer()
+    try:
+        # First job blocks the writer; the rest pile up and collapse
+        for n in range(1, 6):
+            assert collector.save_items("col", [{"id": "a", "quantity": n}], wait=False)
+        gate.set()
+        assert collector.save_items("col", [{"id": "a", "quantity": 6}]) is True
+    finally:
+        collector.stop_writer(timeout=2)
+
+    assert collector._writer_thread is None
+    assert written[-1] == [{"id": "a", "quantity": 6}]
+    assert len(written) < 6
+    assert json.loads((tmp_path / "col.json").read_text("utf-8"))[0]["quantity"] == 6
+
+
+def test_save_does_not_hang_when_writer_dies(patch_config, monkeypatch, tmp_path):
+    monkeypatch.setattr(collector, "_WRITER_POLL", 0.01)
+
+    def dying_writer():
+        # Takes the job and exits without ever finishing it
+        collector._writer_q.get()
+
+    writer = threading.Thread(target=dying_writer, daemon=True)
+    writer.start()
+    monkeypatch.setattr(collector, "_writer_thread", writer)
+
+    assert collector.save_items("col", [{"id": "a", "quantity": 1}]) is True
+    assert json.loads((tmp_path / "col.json").read_text("utf-8"))[0]["quantity"] == 1
+
+
+def test_autosave_rotation_is_batched(patch_config, monkeypatch, tmp_path):
+    patch_config(MAX_BACKUPS=1, BACKUP_ROTATE_EVERY=3)
+    monkeypatch.setattr(collector, "_saves_since_rotate", 0)
+    rotations = []
+    real_rotate = collector.rotate_backups
+
+    def spy_rotate(*args, **kwargs):
+        rotations.append(args)
+        return real_rotate(*args, **kwargs)
+
+    monkeypatch.setattr(collector, "rotate_backups", spy_rotate)
+
+    for n in range(5):
+        assert collector.save_items("col", [{"id": "a", "quantity": n}], durable=False)
+    assert len(rotations) == 1
+    assert collector.save_items("col", [{"id": "a", "quantity": 5}])
+    assert len(rotations) == 2
+    assert len(list(tmp_path.glob("col_*_bak.json"))) == 1
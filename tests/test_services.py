@@ -2,21 +2,48 @@ import pytest
 from datetime import datetime
 import api.services as services
 
-def test_get_item_by_id_found(monkeypatch):
-    sample = [{"id": 1, "name": "Alpha"}]
-    monkeypatch.setattr(services, "load_items", lambda path: sample)
-    result = services.get_item_by_id(1)
-    assert result is sample[0]
+def _returner(val):
+    """One-argument stand-in that always returns 'val' (bound now, not late)."""
+    return lambda _arg, _val=val: _val
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    """Give each test an empty file-level cache (restored afterwards)."""
+    monkeypatch.setattr(services, "_CACHE", {"stamp": None, "items": None, "derived": {}})
     
-def test_get_item_by_id_not_found(monkeypatch):
-    sample = [{"id": 2, "name": "Beta"}]
-    monkeypatch.setattr(services, "load_items", lambda path: sample)
+@pytest.fixture
+def patched_load_items(monkeypatch, request):
+    """Make 'services.load_items' return the parametrized payload (returned too)."""
+    payload = request.param
+    monkeypatch.setattr(services, "load_items", _returner(payload))
+    return payload
+
+@pytest.mark.parametrize(
+    "patched_load_items, expected",
+    [
+        ([{"id": 1, "name": "Alpha"}], 0),    # found: the very same dict
+        ([{"id": 2, "name": "Beta"}], None),  # not found
+    ],
+    indirect=["patched_load_items"],
+)
+def test_get_item_by_id(patched_load_items, expected):
     result = services.get_item_by_id(1)
-    assert result is None
+    if expected is None:
+        assert result is None
+    else:
+        assert result is patched_load_items[expected]
+    
+class _FrozenDatetime(datetime):
+    """'datetime' whose 'now()' is always 2025-01-01 00:00:00."""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 1, 1)
     
 def test_create_item_invokes_create_new_item(monkeypatch):
     items = []
-    monkeypatch.setattr(services, "load_items", lambda path: items)
+    monkeypatch.setattr(services, "datetime", _FrozenDatetime)
+    monkeypatch.setattr(services, "load_items", _returner(items))
     captured = {}
     def fake_create(name, lst, category, qty, ts):
         captured.update({
@@ -33,39 +60,105 @@ def test_create_item_invokes_create_new_item(monkeypatch):
     assert out == {"id": 99}
     
     assert captured["name"] == "ItemX"
-    assert captured["lst"] is items
+    assert captured["lst"] == items
+    assert captured["lst"] is not items  # the cached list is never mutated
     assert captured["category"] == "CatY"
     assert captured["qty"] == 7
-    assert isinstance(captured["ts"], str)
-    datetime.strptime(captured["ts"], "%Y-%m-%d %H:%M:%S")
-    
-def test_search_items_forwards_to_analysis(monkeypatch):
-    sample_items = [{"id": 1}, {"id":2}]
-    monkeypatch.setattr(services, "load_items", lambda path: sample_items)
-    monkeypatch.setattr(services, "search_by_keyword", lambda items, kw: ["RESULT", items, kw])
-    out = services.search_items("foo")
-    assert out == ["RESULT", sample_items, "foo"]
-    
-def test_filter_items_forwards_to_analysis(monkeypatch):
-    sample_items = [{"id":3}]
-    monkeypatch.setattr(services, "load_items", lambda path: sample_items)
-    monkeypatch.setattr(services, "filter_by_category", lambda items, cat: ["F", items, cat])
-    out = services.filter_items("bar")
-    assert out == ["F", sample_items, "bar"]
-    
-def test_category_distribution_transforms_counts(monkeypatch):
-    raw = {"A": 5, "B": 2}
-    monkeypatch.setattr(services, "load_items", lambda path: None)
-    monkeypatch.setattr(services, "get_category_distribution", lambda items: raw)
-    out = services.category_distribution()
+    assert captured["ts"] == "2025-01-01 00:00:00"
+    
+@pytest.mark.parametrize(
+    "patched_load_items, service, forwarder, tag, arg",
+    [
+        ([{"id": 1}, {"id":2}], "search_items", "search_by_keyword", "RESULT", "foo"),
+        ([{"id":3}], "filter_items", "filter_by_category", "F", "bar"),
+    ],
+    indirect=["patched_load_items"],
+)
+def test_forwards_to_analysis(monkeypatch, patched_load_items, service, forwarder, tag, arg):
+    monkeypatch.setattr(services, forwarder, lambda items, value, **_: [tag, items, value])
+    out = getattr(services, service)(arg)
+    assert out == [tag, patched_load_items, arg]
     
+@pytest.mark.parametrize(
+    "patched_load_items, service, helper, raw, expected",
+    [
+        (None, "category_distribution", "get_category_distribution", {"A": 5, "B": 2},
+         [{"category": "A", "count": 5}, {"category": "B", "count": 2}]),
+        (None, "time_distribution", "get_time_distribution", {"2025-07": 10},
+         [{"period": "2025-07", "count": 10}]),
+    ],
+    indirect=["patched_load_items"],
+)
+def test_distribution_transforms_counts(monkeypatch, patched_load_items, service, helper, raw, expected):
+    monkeypatch.setattr(services, helper, _returner(raw))
+    out = getattr(services, service)()
     assert isinstance(out, list)
-    assert {"category": "A", "count": 5} in out
-    assert {"category": "B", "count": 2} in out
-    
-def test_time_distribution_transforms_counts(monkeypatch):
-    raw = {"2025-07": 10}
-    monkeypatch.setattr(services, "load_items", lambda path: None)
-    monkeypatch.setattr(services, "get_time_distribution", lambda items: raw)
-    out = services.time_distribution()
-    assert out == [{"period": "2025-07", "count": 10}]
\ No newline at end of file
+    assert sorted(out, key=str) == sorted(expected, key=str)
+    
+def test_cached_items_reloads_only_when_file_changes(monkeypatch, tmp_path):
+    path = tmp_path / "default_collection.json"
+    path.write_text('[{"id": 1, "name": "Alpha"}]', encoding="utf-8")
+    monkeypatch.setattr(services, "default_path", lambda: path)
+    loads = []
+    real_load = services.load_items
+    monkeypatch.setattr(services, "load_items", lambda p: loads.append(p) or real_load(p))
+    
+    first = services.get_all_items()
+    second = services.get_all_items()
+    assert first == second == [{"id": 1, "name": "Alpha"}]
+    assert len(loads) == 1
+    
+    path.write_text('[{"id": 1, "name": "Alpha"}, {"id": 2, "name": "Beta"}]', encoding="utf-8")
+    assert len(services.get_all_items()) == 2
+    assert len(loads) == 2
+    
+def test_distributions_computed_once_per_file_version(monkeypatch, tmp_path):
+    path = tmp_path / "default_collection.json"
+    path.write_text('[{"category": "A", "quantity": 2, "time": "2025-07-01 00:00:00"}]', encoding="utf-8")
+    monkeypatch.setattr(services, "default_path", lambda: path)
+    calls = []
+    real_dist = services.get_category_distribution
+    monkeypatch.setattr(services, "get_category_distribution", lambda items: calls.append(1) or real_dist(items))
+    
+    assert services.category_distribution() == [{"category": "A", "count": 2}]
+    assert services.category_distribution() == [{"category": "A", "count": 2}]
+    assert len(calls) == 1
+    
+    path.write_text('[{"category": "B", "quantity": 10, "time": "2025-07-01 00:00:00"}]', encoding="utf-8")
+    assert services.category_distribution() == [{"category": "B", "count": 10}]
+    assert len(calls) == 2
+    
+def test_get_item_by_id_uses_index_and_accepts_string_ids(monkeypatch, tmp_path):
+    path = tmp_path / "default_collection.json"
+    path.write_text('[{"id": "abc", "name": "First"}, {"id": "abc", "name": "Dup"}, {"id": 7, "name": "Int"}]', encoding="utf-8")
+    monkeypatch.setattr(services, "default_path", lambda: path)
+    assert services.get_item_by_id("abc")["name"] == "First"
+    assert services.get_item_by_id(7)["name"] == "Int"
+    assert services.get_item_by_id("7")["name"] == "Int"
+    assert services.get_item_by_id("missing") is None
+    
+def test_items_resolved_once_per_request(monkeypatch):
+    from flask import Flask
+    calls = []
+    sample = [{"id": 1, "name": "Alpha", "category": "A", "quantity": 1, "time": "2025-07-01 00:00:00"}]
+    monkeypatch.setattr(services, "_cached_items", lambda: calls.append(1) or sample)
+    with Flask(__name__).test_request_context():
+        services.get_all_items()
+        services.search_items("alp")
+        services.category_distribution()
+        assert len(calls) == 1
+    services.get_all_items()
+    assert len(calls) == 2
+    
+def test_create_item_leaves_cached_snapshot_alone(monkeypatch, tmp_path):
+    path = tmp_path / "default_collection.json"
+    path.write_text('[{"id": "a", "name": "Alpha", "category": "A", "quantity": 1, "time": "2025-07-01 00:00:00"}]', encoding="utf-8")
+    monkeypatch.setattr(services, "default_path", lambda: path)
+    before = services._cached_items()
+    assert services.get_item_by_id("a")["name"] == "Alpha"
+    
+    created = services.create_item("Beta", "B", 2)
+    assert created["name"] == "Beta"
+    assert services._cached_items() is before
+    assert [item["name"] for item in before] == ["Alpha"]
+    assert services.get_item_by_id(created["id"]) is None
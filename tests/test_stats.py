@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from collectory import collector
+
+
+def test_parse_time_or_none_is_memoized():
+    collector._parse_time_or_none.cache_clear()
+    first = collector._parse_time_or_none("2025-01-02 03:04:05")
+    assert first is not None and first.day == 2
+    assert collector._parse_time_or_none("2025-01-02 03:04:05") is first
+    assert collector._parse_time_or_none("not a time") is None
+    assert collector._parse_time_or_none.cache_info().hits == 1
+
+
+def test_parse_time_fast_path_matches_strptime():
+    collector._parse_time_or_none.cache_clear()
+    for raw in ("2024-02-29 23:59:59", "2025-02-29 00:00:00", "2025-01-01 00:00:60",
+                "2025-1-2 3:4:5", "2025-01-01T00:00:00", "2025-01-01 00:00:0x"):
+        try:
+            expected = datetime.strptime(raw, collector.TIME_FMT)
+        except ValueError:
+            expected = None
+        assert collector._parse_time_or_none(raw) == expected, raw
+
+
+def test_oldest_newest_single_pass(capsys):
+    items = [
+        {"name": "Mid", "time": "2024-06-01 00:00:00"},
+        {"name": "Old", "time": "2020-01-01 00:00:00"},
+        {"name": "Bad", "time": "garbage"},
+        {"name": "New", "time": "2025-01-01 00:00:00"},
+        {"name": "OldTwin", "time": "2020-01-01 00:00:00"},
+    ]
+    collector.oldest_newest(items)
+    out = capsys.readouterr().out
+    assert "Oldest item: Old\n" in out
+    assert "Newest item: New\n" in out
+
+
+def test_oldest_newest_without_valid_times(capsys):
+    collector.oldest_newest([{"name": "A", "time": "bad"}, {"name": "B"}])
+    assert "No valid timestamps" in capsys.readouterr().out
+
+
+def test_items_per_category_counts_rows(capsys):
+    items = [{"category": c} for c in ("B", "A", "A", "C", "B", "A")]
+    assert collector.items_per_category(items) is True
+    lines = [line.strip() for line in capsys.readouterr().out.splitlines()[1:]]
+    assert lines == ["A: 3", "B: 2", "C: 1"]
+    assert collector.items_per_category([]) is False
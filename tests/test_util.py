@@ -1,26 +1,51 @@
-import unittest, tempfile, time, os
-from pathlib import Path
+import os
 from collectory.collector import rotate_backups
-class TestBackupRotation(unittest.TestCase):
-    def test_rotate_backups(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            d = Path(tmpdir)
-            prefix = "testcol"
-            paths = []
-            for i in range(5):
-                p = d / f"{prefix}_{i}_backup.json"
-                p.write_text("data")
-                stamp  = time.time() + i
-                os.utime(p, (stamp, stamp))
-                paths.append(p)
-                time.sleep(0.01)
-            rotate_backups(d, prefix, keep=3)
-            remaining = sorted(p.name for p in d.iterdir())
-            
-            self.assertCountEqual(
-                remaining,
-                [paths[4].name, paths[3].name, paths[2].name]
-            )
-        
-if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+
+def test_rotate_backups(tmp_path):
+    prefix = "testcol"
+    paths = []
+    for i in range(5):
+        p = tmp_path / f"{prefix}_{i}_backup.json"
+        p.touch()
+        # mtimes run opposite to the name stamps: the name decides
+        stamp = 1_700_000_000 - i
+        os.utime(p, (stamp, stamp))
+        paths.append(p)
+    rotate_backups(tmp_path, prefix, keep=3)
+    remaining = {p.name for p in tmp_path.iterdir()}
+    
+    assert remaining == {paths[4].name, paths[3].name, paths[2].name}
+
+
+def test_rotate_backups_orders_by_name_stamp(tmp_path):
+    names = [
+        "col_20240101T000000_backup.json",
+        "col_20241231T235959_backup.json",
+        "col_20250101T000000_000000001_backup.json",
+        "col_20250101T000000_500000000_backup.json",
+    ]
+    for age, name in enumerate(names):
+        path = tmp_path / name
+        path.write_text("[]")
+        # mtimes deliberately disagree with the names
+        stamp = 1_700_000_000 - age * 100
+        os.utime(path, (stamp, stamp))
+    (tmp_path / "col_notes_backup.json").write_text("keep me")
+
+    assert rotate_backups(tmp_path, "col", keep=2) is True
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([
+        "col_20250101T000000_000000001_backup.json",
+        "col_20250101T000000_500000000_backup.json",
+        "col_notes_backup.json",
+    ])
+
+
+def test_rotate_backups_orders_mixed_stamp_formats(tmp_path):
+    # Same second, written before and after the '_<ns>' stamp was introduced
+    old = "col_20250101T000000_backup.json"
+    new = "col_20250101T000000_000000001_backup.json"
+    for name in (old, new):
+        (tmp_path / name).write_text("[]")
+
+    assert rotate_backups(tmp_path, "col", keep=1) is True
+    assert [p.name for p in tmp_path.iterdir()] == [new]